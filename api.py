@@ -1,24 +1,44 @@
 import os
+import asyncio
+import importlib.util
 import datetime
 import numpy as np
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
 import logging
+from functools import lru_cache
 import unicodedata
-import matplotlib.pyplot as plt
 from io import BytesIO
-import base64
+from PIL import Image, ImageDraw, ImageFont
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 from pydub import AudioSegment
-from pydub.generators import Sine
 import uuid
 import pandas as pd
 import json
+import hashlib
+from collections import OrderedDict
 import sys
 import subprocess
+import threading
 from fastapi.responses import FileResponse
 
+try:
+    import lameenc
+except ImportError:  # lameenc é opcional; sem ele o MP3 sai do ffmpeg via pydub
+    lameenc = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash é opcional; sem ele a chave sai do blake2b do hashlib
+    xxhash = None
+
+try:
+    import pymtpng
+except ImportError:  # pymtpng é opcional; sem ele o PNG sai do encoder do Pillow
+    pymtpng = None
+
 # =============================================
 # CONFIGURAÇÕES GLOBAIS
 # =============================================
@@ -30,59 +50,174 @@ logger = logging.getLogger(__name__)
 class Config:
     TOTAL_DURATION_SECONDS = 30
     DEFAULT_VOLUME = -10  # dB
+    VOLUME_LINEAR = 10 ** (DEFAULT_VOLUME / 20)  # ganho linear de DEFAULT_VOLUME
     MIN_FREQUENCY_HZ = 18000  # 18 kHz
     MAX_FREQUENCY_HZ = 22000  # 22 kHz
     SAMPLE_RATE = 44100  # Hz
     BIT_RATE = "192k"    # Qualidade MP3
+    MP3_TAGS = {
+        'title': 'NeuroAudio',
+        'artist': 'NeuroAudio System',
+        'comment': 'Gerado automaticamente'
+    }
     REQUIRED_EXCEL_COLUMN = "THz"
+    # Conjuntos de frequências distintos com estatísticas e histograma em cache
+    REPORT_CACHE_SIZE = 32
+    # Leitor calamine (Rust) quando instalado; padrão do pandas (openpyxl) caso contrário
+    EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
 
 # =============================================
 # FUNÇÕES AUXILIARES
 # =============================================
+@lru_cache(maxsize=1024)
+def _strip_accents(text):
+    """Decompõe em NFD e descarta o que não é ASCII; os textos do relatório se repetem."""
+    normalized = unicodedata.normalize('NFD', text)
+    return normalized.encode('ascii', 'ignore').decode('ascii')
+
 def remove_accents(text):
     """Remove acentos e caracteres especiais."""
     if isinstance(text, str):
-        normalized = unicodedata.normalize('NFD', text)
-        ascii_text = normalized.encode('ascii', 'ignore').decode('ascii')
-        ascii_text = ascii_text.replace('ç', 'c').replace('Ç', 'C')
-        return ascii_text
+        return text if text.isascii() else _strip_accents(text)
     return str(text)
 
-def generate_histogram_base64(frequencies: List[float]):
-    """Gera histograma das frequências em base64."""
+HIST_SIZE = (1000, 500)
+HIST_MARGINS = (80, 50, 30, 70)  # esquerda, topo, direita, base (px)
+
+def _hist_font(size):
+    """Fonte TrueType embutida do Pillow; bitmap padrão em versões antigas ou sem FreeType."""
     try:
-        plt.figure(figsize=(10, 5))
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+def _draw_text(draw, xy, text, font, anchor, fill="black"):
+    """Texto ancorado pela caixa do texto (horizontal l/m/r, vertical t/m/b).
+
+    O `anchor` do Pillow só existe para fontes TrueType e a fonte bitmap
+    de fallback o rejeita; textbbox vale para as duas.
+    """
+    x0, y0, x1, y1 = draw.textbbox((0, 0), text, font=font)
+    x, y = xy
+    x -= {"l": x0, "m": (x0 + x1) / 2, "r": x1}[anchor[0]]
+    y -= {"t": y0, "m": (y0 + y1) / 2, "b": y1}[anchor[1]]
+    draw.text((x, y), text, fill=fill, font=font)
+
+def _dashed_vline(draw, x, top, bottom, fill, dash, gap, width=2):
+    """Linha vertical tracejada (ImageDraw não tem estilo de linha)."""
+    for y in range(top, bottom, dash + gap):
+        draw.line([(x, y), (x, min(y + dash, bottom))], fill=fill, width=width)
+
+def compute_frequency_stats(frequencies: List[float]) -> dict:
+    """Estatísticas de ordem e momentos das frequências, calculadas uma única vez."""
+    freq_array = np.asarray(frequencies, dtype=np.float64)
+    # Mínimo, quartis, mediana e máximo numa única ordenação parcial
+    f_min, q1, median, q3, f_max = np.quantile(freq_array, [0.0, 0.25, 0.5, 0.75, 1.0])
+    mean = freq_array.mean()
+    return {
+        "array": freq_array,
+        "count": len(freq_array),
+        "min": f_min,
+        "max": f_max,
+        "mean": mean,
+        "median": median,
+        "std": np.sqrt(np.dot(freq_array - mean, freq_array - mean) / len(freq_array)),
+        "q1": q1,
+        "q3": q3
+    }
+
+def generate_histogram_png(frequencies: List[float], summary: Optional[dict] = None) -> bytes:
+    """Gera histograma das frequências como bytes PNG."""
+    try:
+        if summary is None:
+            summary = compute_frequency_stats(frequencies)
+        freq_array = summary["array"]
+        f_min, q1, q3, f_max = summary["min"], summary["q1"], summary["q3"], summary["max"]
         
-        # Cálculo dinâmico de bins
-        freq_array = np.array(frequencies)
-        iqr = np.percentile(freq_array, 75) - np.percentile(freq_array, 25)
-        bin_width = 2 * iqr / (len(freq_array) ** (1/3))
-        bins = int((np.max(freq_array) - np.min(freq_array)) / bin_width) if bin_width > 0 else 10
+        # Cálculo dinâmico de bins (Freedman-Diaconis, o mesmo que bins='fd')
+        bin_width = 2 * (q3 - q1) / (len(freq_array) ** (1/3))
+        bins = int((f_max - f_min) / bin_width) if bin_width > 0 else 10
         bins = max(min(bins, 20), 5)  # Limita entre 5-20 bins
+        counts, edges = np.histogram(freq_array, bins=bins, range=(f_min, f_max))
+        
+        # Desenho direto no raster: barras, 2 linhas e texto não justificam
+        # o custo fixo de uma figura do matplotlib por requisição
+        width, height = HIST_SIZE
+        left, top, right, bottom = HIST_MARGINS
+        plot_w = width - left - right
+        plot_h = height - top - bottom
+        img = Image.new("RGB", HIST_SIZE, "white")
+        draw = ImageDraw.Draw(img)
+        font = _hist_font(14)
         
-        # Plotagem
-        n, bins, patches = plt.hist(freq_array, bins=bins, color='#1f77b4', 
-                                  edgecolor='black', alpha=0.7)
+        x_min, x_max = float(edges[0]), float(edges[-1])
+        x_span = (x_max - x_min) or 1.0
+        y_max = max(int(counts.max()), 1) * 1.05
+        
+        def to_x(value):
+            return left + (value - x_min) / x_span * plot_w
+        
+        def to_y(count):
+            return top + plot_h - count / y_max * plot_h
+        
+        # Grade horizontal e rótulos do eixo y
+        y_step = max(int(np.ceil(counts.max() / 5)), 1)
+        for tick in range(0, int(y_max) + 1, y_step):
+            y = to_y(tick)
+            draw.line([(left, y), (left + plot_w, y)], fill="#d9d9d9")
+            _draw_text(draw, (left - 8, y), str(tick), font, "rm")
+        
+        bar_fill = (98, 156, 200)  # #1f77b4 com alpha 0.7 sobre branco
+        for count, lo, hi in zip(counts, edges[:-1], edges[1:]):
+            if count:
+                draw.rectangle([to_x(lo), to_y(count), to_x(hi), to_y(0)],
+                               fill=bar_fill, outline="black")
         
         # Linhas de referência
-        mean_freq = float(np.mean(freq_array))
-        median_freq = float(np.median(freq_array))
-        plt.axvline(mean_freq, color='red', linestyle='--', linewidth=1.5, 
-                   label=f'Média: {mean_freq:.3f} THz')
-        plt.axvline(median_freq, color='green', linestyle=':', linewidth=1.5, 
-                   label=f'Mediana: {median_freq:.3f} THz')
+        mean_freq = float(summary["mean"])
+        median_freq = float(summary["median"])
+        _dashed_vline(draw, to_x(mean_freq), top, top + plot_h, "red", 10, 6)
+        _dashed_vline(draw, to_x(median_freq), top, top + plot_h, "green", 3, 4)
         
-        plt.title('Distribuição de Frequências', fontsize=12, pad=20)
-        plt.xlabel('Frequência (THz)', fontsize=10)
-        plt.ylabel('Contagem', fontsize=10)
-        plt.grid(axis='y', alpha=0.4)
-        plt.legend()
+        # Eixos e rótulos do eixo x
+        draw.rectangle([left, top, left + plot_w, top + plot_h], outline="black")
+        for tick in np.linspace(x_min, x_max, 6):
+            _draw_text(draw, (to_x(tick), top + plot_h + 8), f"{tick:.3f}", font, "mt")
         
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close()
+        # A fonte embutida cobre só ASCII, como as fontes padrão do FPDF
+        _draw_text(draw, (width / 2, top / 2), remove_accents("Distribuição de Frequências"),
+                   _hist_font(18), "mm")
+        _draw_text(draw, (left + plot_w / 2, height - 16), remove_accents("Frequência (THz)"),
+                   font, "mb")
+        y_label = Image.new("RGB", (200, 24), "white")
+        _draw_text(ImageDraw.Draw(y_label), (100, 12), "Contagem", font, "mm")
+        img.paste(y_label.rotate(90, expand=True), (8, top + plot_h // 2 - 100))
+        
+        # Legenda
+        legend = [("red", remove_accents(f"Média: {mean_freq:.3f} THz")),
+                  ("green", f"Mediana: {median_freq:.3f} THz")]
+        lx, ly = left + plot_w - 230, top + 10
+        draw.rectangle([lx, ly, lx + 220, ly + 52], fill="white", outline="#bfbfbf")
+        for i, (color, label) in enumerate(legend):
+            y = ly + 14 + i * 24
+            draw.line([(lx + 10, y), (lx + 40, y)], fill=color, width=2)
+            _draw_text(draw, (lx + 48, y), label, font, "lm")
         
-        return base64.b64encode(buffer.getvalue()).decode('utf-8')
+        # PNG sem otimização: compressão rápida basta para o relatório.
+        # O mtpng (Rust) comprime em paralelo em todos os núcleos; se a
+        # versão instalada falhar, o relatório sai com o encoder do Pillow
+        if pymtpng is not None:
+            buffer = BytesIO()
+            try:
+                pymtpng.encode_png(np.asarray(img), buffer,
+                                   compression_level=pymtpng.CompressionLevel.Fast)
+                return buffer.getvalue()
+            except Exception as e:
+                logger.warning(f"pymtpng falhou, usando o encoder do Pillow: {e}")
+        
+        buffer = BytesIO()
+        img.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
     except Exception as e:
         logger.error(f"Erro ao gerar histograma: {e}")
         raise
@@ -91,11 +226,16 @@ def generate_histogram_base64(frequencies: List[float]):
 # GERADOR DE ÁUDIO
 # =============================================
 class NeuroAudioGenerator:
-    def __init__(self):
-        self.audio_segment = AudioSegment.silent(
-            duration=Config.TOTAL_DURATION_SECONDS * 1000,
-            frame_rate=Config.SAMPLE_RATE
-        )
+    # Amostras do clipe completo
+    SAMPLES = Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS
+
+    def __init__(self, mix_buf: Optional[np.ndarray] = None, spectrum: Optional[np.ndarray] = None):
+        # Os buffers preparados no startup são reaproveitados entre
+        # requisições; sem eles (uso fora da API) cada gerador aloca os seus.
+        # O mix é float64 para a irfft escrever nele direto (out=)
+        self.mix_buf = mix_buf if mix_buf is not None else np.zeros(self.SAMPLES, np.float64)
+        self.spectrum = spectrum if spectrum is not None else np.zeros(self.SAMPLES // 2 + 1, np.complex128)
+        self.pcm = None
 
     @staticmethod
     def thz_to_hz(thz: float) -> float:
@@ -105,49 +245,97 @@ class NeuroAudioGenerator:
         hz = thz * 1e12
         return min(max(hz, Config.MIN_FREQUENCY_HZ), Config.MAX_FREQUENCY_HZ)
 
-    def generate_tone(self, frequency_hz: float) -> AudioSegment:
-        """Gera tom senoidal."""
-        try:
-            return Sine(frequency_hz, sample_rate=Config.SAMPLE_RATE).to_audio_segment(
-                duration=Config.TOTAL_DURATION_SECONDS * 1000,
-                volume=Config.DEFAULT_VOLUME
-            )
-        except Exception as e:
-            logger.error(f"Erro ao gerar tom: {e}")
-            raise
+    def synthesize_tones(self, frequencies_hz: np.ndarray, weights: np.ndarray) -> None:
+        """Escreve no buffer de mix a soma dos tons, montada no espectro e com uma única IFFT."""
+        # Em 30 s os bins do espectro ficam a SR / SAMPLES = 1/30 Hz: a grade
+        # de 0.1 Hz de add_frequencies cai exatamente sobre eles, e o custo
+        # fica em O(N log N) qualquer que seja o número de tons.
+        # Um seno de amplitude A no bin k é -i * A * N / 2 na irfft
+        bins = np.rint(frequencies_hz * self.SAMPLES / Config.SAMPLE_RATE).astype(np.int64)
+        self.spectrum.fill(0)
+        np.add.at(self.spectrum, bins, -0.5j * self.SAMPLES * np.asarray(weights, dtype=np.float64))
+        # Sem array novo: a IFFT escreve no próprio buffer de mix
+        np.fft.irfft(self.spectrum, n=self.SAMPLES, out=self.mix_buf)
 
     def add_frequencies(self, frequencies_thz: List[float]) -> None:
         """Adiciona frequências ao mix."""
         total = len(frequencies_thz)
         logger.info(f"Processando {total} frequências...")
         
-        for i, thz in enumerate(frequencies_thz, 1):
-            try:
-                hz = self.thz_to_hz(thz)
-                tone = self.generate_tone(hz)
-                self.audio_segment = self.audio_segment.overlay(tone)
-                
-                if i % 100 == 0 or i == total:
-                    logger.info(f"Progresso: {i}/{total}")
-            except Exception as e:
-                logger.warning(f"Frequência {thz}THz ignorada: {str(e)}")
-                continue
+        # Mesma conversão de thz_to_hz, aplicada ao array inteiro de uma vez;
+        # valores não numéricos viram NaN e são descartados junto com eles
+        freqs_thz = np.asarray(pd.to_numeric(frequencies_thz, errors="coerce"), dtype=np.float64)
+        valid = np.isfinite(freqs_thz)
+        if not valid.all():
+            logger.warning(f"{total - int(valid.sum())} frequências inválidas ignoradas")
+        freqs_hz = np.clip(freqs_thz[valid] * 1e12, Config.MIN_FREQUENCY_HZ, Config.MAX_FREQUENCY_HZ)
+        tones = len(freqs_hz)
+        
+        # Após o clip muitas entradas caem na mesma frequência (nos limites da
+        # faixa ou repetidas no Excel): cada tom distinto, em passos de 0.1 Hz,
+        # é sintetizado uma vez com peso igual ao número de repetições
+        unique_hz, counts = np.unique(np.round(freqs_hz, 1), return_counts=True)
+        if len(unique_hz) < tones:
+            logger.info(f"{tones} frequências, {len(unique_hz)} tons distintos")
+        
+        self.synthesize_tones(unique_hz, counts)
+        logger.info(f"Progresso: {tones}/{total}")
+        
+        # Cada tom em DEFAULT_VOLUME; dividir pela quantidade de tons mantém a
+        # soma dentro do int16, como no backend do Render
+        scale = Config.VOLUME_LINEAR * 32767 / max(tones, 1)
+        # Escala, arredonda e limita no próprio buffer de mix; só o PCM final,
+        # que precisa sobreviver ao lock até a codificação, é alocado
+        np.multiply(self.mix_buf, scale, out=self.mix_buf)
+        np.rint(self.mix_buf, out=self.mix_buf)
+        np.clip(self.mix_buf, -32768, 32767, out=self.mix_buf)
+        self.pcm = self.mix_buf.astype("<i2")
+
+    @staticmethod
+    def _id3_tags(tags: dict) -> bytes:
+        """Cabeçalho ID3v2.3 com título, artista e comentário (o lameenc não grava tags)."""
+        def frame(frame_id, payload):
+            return frame_id + len(payload).to_bytes(4, "big") + b"\x00\x00" + payload
+        
+        # Texto em latin-1 (codificação 0); o comentário leva idioma e descrição vazia
+        body = (frame(b"TIT2", b"\x00" + tags['title'].encode("latin-1"))
+                + frame(b"TPE1", b"\x00" + tags['artist'].encode("latin-1"))
+                + frame(b"COMM", b"\x00por\x00" + tags['comment'].encode("latin-1")))
+        size = len(body)
+        synchsafe = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+        return b"ID3\x03\x00\x00" + synchsafe + body
+
+    def encode_mp3(self) -> bytes:
+        """Codifica o PCM int16 em MP3 no próprio processo, sem subprocesso do ffmpeg."""
+        pcm = self.pcm if self.pcm is not None else np.zeros(self.SAMPLES, "<i2")
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(int(Config.BIT_RATE.rstrip("k")))
+        encoder.set_in_sample_rate(Config.SAMPLE_RATE)
+        encoder.set_channels(1)
+        encoder.set_quality(2)
+        return self._id3_tags(Config.MP3_TAGS) + encoder.encode(pcm.tobytes()) + encoder.flush()
 
     def save_audio(self, output_path: str) -> None:
         """Exporta arquivo MP3."""
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            self.audio_segment.export(
-                output_path,
-                format="mp3",
-                bitrate=Config.BIT_RATE,
-                tags={
-                    'title': 'NeuroAudio',
-                    'artist': 'NeuroAudio System',
-                    'comment': 'Gerado automaticamente'
-                }
-            )
+            if lameenc is not None:
+                with open(output_path, "wb") as mp3_file:
+                    mp3_file.write(self.encode_mp3())
+            else:
+                pcm = self.pcm if self.pcm is not None else np.zeros(self.SAMPLES, "<i2")
+                AudioSegment(
+                    data=pcm.tobytes(),
+                    sample_width=2,
+                    frame_rate=Config.SAMPLE_RATE,
+                    channels=1
+                ).export(
+                    output_path,
+                    format="mp3",
+                    bitrate=Config.BIT_RATE,
+                    tags=Config.MP3_TAGS
+                )
             
             if not os.path.exists(output_path):
                 raise RuntimeError(f"Arquivo não criado: {output_path}")
@@ -160,11 +348,40 @@ class NeuroAudioGenerator:
 # =============================================
 # GERADOR DE PDF
 # =============================================
+# Estatísticas e PNG do histograma por conteúdo das frequências (LRU); o PDF
+# roda em thread, então o acesso ao dicionário passa pelo lock
+report_cache = OrderedDict()
+report_cache_lock = threading.Lock()
+
+def cached_report_assets(frequencies: List[float]) -> dict:
+    """Estatísticas (e espaço para o histograma) do conjunto de frequências, em cache."""
+    # A ordem das linhas não muda o relatório: a chave é o hash do array ordenado
+    freq_sorted = np.sort(np.asarray(frequencies, dtype=np.float64))
+    if xxhash is not None:
+        key = xxhash.xxh3_64_hexdigest(freq_sorted.tobytes())
+    else:
+        key = hashlib.blake2b(freq_sorted.tobytes(), digest_size=8).hexdigest()
+    
+    with report_cache_lock:
+        assets = report_cache.get(key)
+        if assets is not None:
+            report_cache.move_to_end(key)
+            return assets
+    
+    assets = {"summary": compute_frequency_stats(freq_sorted), "histogram": None}
+    with report_cache_lock:
+        report_cache[key] = assets
+        if len(report_cache) > Config.REPORT_CACHE_SIZE:
+            report_cache.popitem(last=False)
+    return assets
+
 def generate_pdf_report(frequencies: List[float], pdf_filename: str, aroma_id: str, 
                       company_name: str, output_dir: str = "output") -> str:
     """Gera relatório PDF completo."""
     try:
         pdf = FPDF()
+        # Streams das páginas comprimidos com deflate (padrão do fpdf2, explícito)
+        pdf.set_compression(True)
         pdf.add_page()
         pdf.set_font("Arial", size=12)
         pdf.set_title("Relatório NeuroAudio")
@@ -192,8 +409,9 @@ def generate_pdf_report(frequencies: List[float], pdf_filename: str, aroma_id: s
             f"Duração do Áudio: {Config.TOTAL_DURATION_SECONDS} segundos"
         ]
         
-        for item in info_items:
-            pdf.cell(200, 6, remove_accents(item), ln=True)
+        # Um bloco de texto por seção em vez de uma chamada de cell por linha
+        pdf.multi_cell(200, 6, "\n".join(remove_accents(item) for item in info_items),
+                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(10)
 
@@ -202,20 +420,24 @@ def generate_pdf_report(frequencies: List[float], pdf_filename: str, aroma_id: s
         pdf.cell(200, 8, "ESTATÍSTICAS DAS FREQUÊNCIAS", ln=True)
         pdf.ln(5)
         
+        assets = cached_report_assets(frequencies)
+        summary = assets["summary"]
         stats = {
-            "Mínima": np.min(frequencies),
-            "Máxima": np.max(frequencies),
-            "Média": np.mean(frequencies),
-            "Mediana": np.median(frequencies),
-            "Desvio Padrão": np.std(frequencies),
-            "1º Quartil": np.percentile(frequencies, 25),
-            "3º Quartil": np.percentile(frequencies, 75)
+            "Mínima": summary["min"],
+            "Máxima": summary["max"],
+            "Média": summary["mean"],
+            "Mediana": summary["median"],
+            "Desvio Padrão": summary["std"],
+            "1º Quartil": summary["q1"],
+            "3º Quartil": summary["q3"]
         }
         
+        # Rótulos e valores em duas colunas lado a lado
         pdf.set_font("Arial", size=10)
-        for name, value in stats.items():
-            pdf.cell(100, 6, f"{name}:", ln=False)
-            pdf.cell(100, 6, f"{float(value):.6f} THz", ln=True)
+        pdf.multi_cell(100, 6, "\n".join(f"{name}:" for name in stats),
+                       new_x=XPos.RIGHT, new_y=YPos.TOP)
+        pdf.multi_cell(100, 6, "\n".join(f"{float(value):.6f} THz" for value in stats.values()),
+                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(10)
 
@@ -225,14 +447,13 @@ def generate_pdf_report(frequencies: List[float], pdf_filename: str, aroma_id: s
         pdf.ln(5)
         
         try:
-            hist_img = generate_histogram_base64(frequencies)
-            temp_img = "temp_hist.png"
-            with open(temp_img, "wb") as img_file:
-                img_file.write(base64.b64decode(hist_img))
-            
-            pdf.image(temp_img, x=10, y=pdf.get_y(), w=180)
-            pdf.ln(90)
-            os.remove(temp_img)
+            # fpdf2 lê o PNG direto da memória, sem arquivo temporário
+            if assets["histogram"] is None:
+                assets["histogram"] = generate_histogram_png(frequencies, summary)
+            hist_png = assets["histogram"]
+            # Altura segue a proporção do PNG com 180 mm de largura
+            image = pdf.image(BytesIO(hist_png), x=10, y=pdf.get_y(), w=180)
+            pdf.ln(image.rendered_height)
         except Exception as e:
             logger.error(f"Erro no histograma: {e}")
             pdf.cell(200, 6, "Gráfico não disponível", ln=True)
@@ -248,7 +469,10 @@ def generate_pdf_report(frequencies: List[float], pdf_filename: str, aroma_id: s
         # Salva PDF
         os.makedirs(output_dir, exist_ok=True)
         pdf_path = os.path.join(output_dir, pdf_filename)
-        pdf.output(pdf_path)
+        # Serializa em memória e grava o documento inteiro numa única escrita
+        pdf_bytes = pdf.output()
+        with open(pdf_path, "wb") as pdf_file:
+            pdf_file.write(pdf_bytes)
         
         return pdf_path
     except Exception as e:
@@ -258,6 +482,40 @@ def generate_pdf_report(frequencies: List[float], pdf_filename: str, aroma_id: s
 # =============================================
 # ENDPOINTS DA API
 # =============================================
+@app.on_event("startup")
+def allocate_mix_buffers():
+    """Aloca uma vez os buffers de síntese compartilhados pelas requisições."""
+    app.state.mix_buf = np.zeros(NeuroAudioGenerator.SAMPLES, np.float64)
+    app.state.spectrum = np.zeros(NeuroAudioGenerator.SAMPLES // 2 + 1, np.complex128)
+    # Um único par de buffers: uma síntese por vez
+    app.state.mix_lock = threading.Lock()
+
+def read_frequencies(excel_file: BinaryIO) -> np.ndarray:
+    """Lê e valida a coluna THz do Excel enviado."""
+    # Só a coluna THz vira DataFrame
+    df = pd.read_excel(
+        excel_file,
+        engine=Config.EXCEL_ENGINE,
+        usecols=lambda column: column == Config.REQUIRED_EXCEL_COLUMN
+    )
+    if Config.REQUIRED_EXCEL_COLUMN not in df.columns:
+        raise ValueError(f"Coluna '{Config.REQUIRED_EXCEL_COLUMN}' não encontrada")
+    
+    # Permanece em numpy para a síntese e as estatísticas vetorizadas;
+    # textos viram NaN e são descartados como as células vazias
+    frequencies = pd.to_numeric(df[Config.REQUIRED_EXCEL_COLUMN], errors="coerce").dropna()
+    frequencies = frequencies.to_numpy(dtype=np.float64)
+    if frequencies.size == 0:
+        raise ValueError("Nenhuma frequência válida encontrada")
+    return frequencies
+
+def render_audio(frequencies: List[float], audio_path: str) -> None:
+    """Sintetiza e exporta o MP3 usando os buffers compartilhados da API."""
+    generator = NeuroAudioGenerator(app.state.mix_buf, app.state.spectrum)
+    with app.state.mix_lock:
+        generator.add_frequencies(frequencies)
+    generator.save_audio(audio_path)
+
 @app.post("/process-audio")
 async def process_audio(
     file: UploadFile = File(...),
@@ -271,41 +529,36 @@ async def process_audio(
         output_dir = os.path.join("output", remove_accents(company_name))
         os.makedirs(output_dir, exist_ok=True)
 
-        # Processa Excel
+        # Processa Excel: o parse lê direto do arquivo temporário do upload,
+        # sem copiar o corpo para a memória, e roda fora do event loop, que
+        # segue atendendo outras requisições
         try:
-            df = pd.read_excel(file.file)
-            if Config.REQUIRED_EXCEL_COLUMN not in df.columns:
-                raise ValueError(f"Coluna '{Config.REQUIRED_EXCEL_COLUMN}' não encontrada")
-            
-            frequencies = df[Config.REQUIRED_EXCEL_COLUMN].dropna().tolist()
-            if not frequencies:
-                raise ValueError("Nenhuma frequência válida encontrada")
+            frequencies = await asyncio.to_thread(read_frequencies, file.file)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Erro no Excel: {str(e)}")
 
-        # Gera Áudio
+        # Áudio e PDF só compartilham as frequências: rodam em threads em
+        # paralelo e a latência fica no maior dos dois, não na soma
         audio_filename = f"NeuroAudio_{company_name}_{aroma_id}.mp3"
         audio_path = os.path.join(output_dir, audio_filename)
-        
-        try:
-            generator = NeuroAudioGenerator()
-            generator.add_frequencies(frequencies)
-            generator.save_audio(audio_path)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Erro no áudio: {str(e)}")
-
-        # Gera PDF
         pdf_filename = f"Relatorio_{company_name}_{aroma_id}.pdf"
-        try:
-            pdf_path = generate_pdf_report(
+        
+        audio_result, pdf_result = await asyncio.gather(
+            asyncio.to_thread(render_audio, frequencies, audio_path),
+            asyncio.to_thread(
+                generate_pdf_report,
                 frequencies=frequencies,
                 pdf_filename=pdf_filename,
                 aroma_id=aroma_id,
                 company_name=company_name,
                 output_dir=output_dir
-            )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Erro no PDF: {str(e)}")
+            ),
+            return_exceptions=True
+        )
+        if isinstance(audio_result, Exception):
+            raise HTTPException(status_code=500, detail=f"Erro no áudio: {str(audio_result)}")
+        if isinstance(pdf_result, Exception):
+            raise HTTPException(status_code=500, detail=f"Erro no PDF: {str(pdf_result)}")
 
         return {
             "status": "success",
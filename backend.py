@@ -1,87 +1,287 @@
 import os
+import asyncio
+import hashlib
+import json
+import importlib.util
 import datetime
+import subprocess
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
 import logging
 import unicodedata
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
 from io import BytesIO
-import base64
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
-from pydub import AudioSegment
-from pydub.generators import Sine
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 import uuid
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the NumPy mixer is used instead
+    njit = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional, hashlib's blake2b is used instead
+    xxhash = None
+
+try:
+    from fast_histogram import histogram1d
+except ImportError:  # fast-histogram is optional, np.histogram is used instead
+    histogram1d = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional, only Excel uploads are accepted then
+    pa = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class GzipRequestMiddleware:
+    """Inflate request bodies sent with Content-Encoding: gzip before FastAPI parses them.
+
+    Inflation stops at Config.MAX_UPLOAD_BYTES: past that the request is
+    answered with 413, so a small gzip bomb cannot expand in memory.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (b"content-encoding", b"gzip") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        headers = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        inflated = 0
+        rejected = False
+        response_started = False
+
+        async def inflating_receive():
+            nonlocal inflated, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                # One byte past the remaining budget is enough to tell it overflowed
+                remaining = Config.MAX_UPLOAD_BYTES - inflated
+                body = inflater.decompress(message.get("body", b""), remaining + 1)
+                if not message.get("more_body", False) and len(body) <= remaining:
+                    body += inflater.flush()
+                inflated += len(body)
+                if inflated > Config.MAX_UPLOAD_BYTES:
+                    rejected = True
+                    if not response_started:
+                        await send({
+                            "type": "http.response.start",
+                            "status": 413,
+                            "headers": [(b"content-type", b"application/json")]
+                        })
+                        await send({
+                            "type": "http.response.body",
+                            "body": json.dumps({"detail": "Inflated request body too large"}).encode()
+                        })
+                    # The app sees a disconnected client and stops reading
+                    return {"type": "http.disconnect"}
+                message = {**message, "body": body}
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            # After a 413 the app's own error response has nowhere to go
+            if rejected:
+                return
+            response_started = True
+            await send(message)
+
+        await self.app({**scope, "headers": headers}, inflating_receive, guarded_send)
+
 # Initialize FastAPI app
 app = FastAPI(title="NeuroAudio Processing API")
+app.add_middleware(GzipRequestMiddleware)
+
+# Finished jobs by (upload digest, company name), for repeated submissions;
+# least recently used first, at most Config.PROCESSED_JOBS_SIZE entries
+processed_jobs = OrderedDict()
+
+# Jobs started through /jobs: id -> {"state", "version", "changed" event, "task"},
+# plus "finished_at" once done; dropped Config.JOB_TTL_SECONDS after finishing
+background_jobs = {}
 
 class Config:
     TOTAL_DURATION_SECONDS = 30
     DEFAULT_VOLUME = -10
+    VOLUME_LINEAR = 10 ** (DEFAULT_VOLUME / 20)
     MIN_FREQUENCY_HZ = 18000
     MAX_FREQUENCY_HZ = 22000
     SAMPLE_RATE = 44100
     BIT_RATE = "192k"
     REQUIRED_EXCEL_COLUMN = "THz"
+    # Largest request body accepted once gzip is inflated (the UI's upload limit)
+    MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+    # Bounds of the in-memory job registries on a long-running instance
+    PROCESSED_JOBS_SIZE = 256
+    JOB_TTL_SECONDS = 3600
+    # Rust-based reader when python-calamine is installed, pandas' default otherwise
+    EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+    # Opt-in GPU inverse FFT (needs cupy) for mixes with at least GPU_MIN_TONES tones
+    USE_GPU = os.environ.get("USE_GPU", "").lower() in ("1", "true", "yes")
+    GPU_MIN_TONES = 10000
+
+cp = None
+if Config.USE_GPU:
+    try:
+        import cupy as cp
+    except ImportError:
+        logger.warning("USE_GPU is set but cupy is not installed, using the CPU")
+
+@lru_cache(maxsize=1024)
+def _strip_accents(text):
+    """NFD-decompose and drop everything outside ASCII; report text repeats per request."""
+    normalized = unicodedata.normalize('NFD', text)
+    return normalized.encode('ascii', 'ignore').decode('ascii')
 
 def remove_accents(text):
     """Remove accents and special characters."""
     if isinstance(text, str):
-        normalized = unicodedata.normalize('NFD', text)
-        ascii_text = normalized.encode('ascii', 'ignore').decode('ascii')
-        return ascii_text.replace('ç', 'c').replace('Ç', 'C')
+        return text if text.isascii() else _strip_accents(text)
     return str(text)
 
-def generate_histogram_base64(frequencies):
-    """Generate frequency histogram as base64."""
+# Samples per clip; a module constant so the compiled kernel has it folded in
+CLIP_SAMPLES = Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS
+
+if njit is not None:
+    @njit(fastmath=True, nogil=True, cache=True)
+    def _gather_tone_numba(bin_index, table):
+        """Read a DFT-grid tone off the sine table, stepping the phase index by bin_index mod N."""
+        buf = np.empty(CLIP_SAMPLES, dtype=np.float32)
+        m = 0
+        for i in range(CLIP_SAMPLES):
+            buf[i] = table[m]
+            m += bin_index
+            if m >= CLIP_SAMPLES:
+                m -= CLIP_SAMPLES
+        return buf
+else:
+    _gather_tone_numba = None
+
+def content_digest(data):
+    """Fast non-cryptographic hash of uploaded bytes."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def compute_frequency_stats(frequencies):
+    """Compute order statistics and moments from a single sort."""
+    freq_sorted = np.sort(np.asarray(frequencies, dtype=np.float64))
+    n = len(freq_sorted)
+
+    def quantile(q):
+        # Linear interpolation between neighbours, as np.percentile does
+        pos = q * (n - 1)
+        lo = int(pos)
+        hi = min(lo + 1, n - 1)
+        return freq_sorted[lo] + (freq_sorted[hi] - freq_sorted[lo]) * (pos - lo)
+
+    # Central moments from one deviation array: two dot products instead of
+    # separate std and skewness passes
+    deviations = freq_sorted - freq_sorted.mean()
+    squared = deviations * deviations
+    m2 = squared.sum() / n
+    m3 = squared @ deviations / n
+
+    return {
+        "sorted": freq_sorted,
+        "count": n,
+        "unique": int(np.count_nonzero(np.diff(freq_sorted))) + 1,
+        "min": freq_sorted[0],
+        "max": freq_sorted[-1],
+        "mean": freq_sorted.mean(),
+        "median": quantile(0.5),
+        "std": np.sqrt(m2),
+        "skew": m3 / m2 ** 1.5 if m2 > 0 else 0.0,
+        "q1": quantile(0.25),
+        "q3": quantile(0.75)
+    }
+
+# One histogram figure for the process, reused under a lock instead of a new
+# Figure and Agg canvas per report; a bare Figure skips pyplot's global state
+# and fixed margins avoid the extra bbox_inches='tight' render
+_HIST_FIG = Figure(figsize=(10, 5))
+_HIST_FIG.subplots_adjust(left=0.08, right=0.97, top=0.9, bottom=0.12)
+_HIST_AX = _HIST_FIG.add_subplot()
+_HIST_LOCK = threading.Lock()
+
+def generate_histogram_png(frequencies, summary=None):
+    """Generate frequency histogram as PNG bytes."""
     try:
-        plt.figure(figsize=(10, 5))
-        freq_array = np.array(frequencies)
+        if summary is None:
+            summary = compute_frequency_stats(frequencies)
+        freq_array = summary["sorted"]
         
-        # Calculate dynamic bins
-        iqr = np.percentile(freq_array, 75) - np.percentile(freq_array, 25)
-        bin_width = 2 * iqr / (len(freq_array) ** (1/3))
-        bins = int((np.max(freq_array) - np.min(freq_array)) / bin_width) if bin_width > 0 else 10
+        # Calculate dynamic bins (Freedman-Diaconis, limited to 5-20)
+        iqr = summary["q3"] - summary["q1"]
+        bin_width = 2 * iqr / (summary["count"] ** (1/3))
+        bins = int((summary["max"] - summary["min"]) / bin_width) if bin_width > 0 else 10
         bins = max(min(bins, 20), 5)
+        if histogram1d is not None and summary["max"] > summary["min"]:
+            # Uniform bins: fast-histogram's C counter excludes the upper
+            # edge, which np.histogram counts in the last bin
+            counts = histogram1d(freq_array, bins=bins, range=(summary["min"], summary["max"]))
+            counts[-1] += summary["count"] - np.searchsorted(freq_array, summary["max"])
+            edges = np.linspace(summary["min"], summary["max"], bins + 1)
+        else:
+            counts, edges = np.histogram(freq_array, bins=bins)
         
-        # Plot histogram
-        plt.hist(freq_array, bins=bins, color='#1f77b4', edgecolor='black', alpha=0.7)
-        
-        # Add reference lines
-        mean_freq = float(np.mean(freq_array))
-        median_freq = float(np.median(freq_array))
-        plt.axvline(mean_freq, color='red', linestyle='--', linewidth=1.5, 
-                   label=f'Média: {mean_freq:.3f} THz')
-        plt.axvline(median_freq, color='green', linestyle=':', linewidth=1.5, 
-                   label=f'Mediana: {median_freq:.3f} THz')
-        
-        plt.title('Distribuição de Frequências', fontsize=14, fontweight='bold')
-        plt.xlabel('Frequência (THz)', fontsize=12)
-        plt.ylabel('Contagem', fontsize=12)
-        plt.grid(axis='y', alpha=0.4)
-        plt.legend(fontsize=10)
-        
-        # Save to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close()
+        # Plot the precomputed bins on the shared figure, cleared per call
+        mean_freq = float(summary["mean"])
+        median_freq = float(summary["median"])
+        with _HIST_LOCK:
+            ax = _HIST_AX
+            ax.cla()
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                   color='#1f77b4', edgecolor='black', alpha=0.7)
+            
+            # Add reference lines
+            ax.axvline(mean_freq, color='red', linestyle='--', linewidth=1.5, 
+                       label=f'Média: {mean_freq:.3f} THz')
+            ax.axvline(median_freq, color='green', linestyle=':', linewidth=1.5, 
+                       label=f'Mediana: {median_freq:.3f} THz')
+            
+            ax.set_title('Distribuição de Frequências', fontsize=14, fontweight='bold')
+            ax.set_xlabel('Frequência (THz)', fontsize=12)
+            ax.set_ylabel('Contagem', fontsize=12)
+            ax.grid(axis='y', alpha=0.4)
+            ax.legend(fontsize=10)
+            
+            # 90 dpi is plenty at 180 mm wide in the PDF
+            buffer = BytesIO()
+            _HIST_FIG.savefig(buffer, format='png', dpi=90)
         
-        return base64.b64encode(buffer.getvalue()).decode('utf-8')
+        return buffer.getvalue()
     except Exception as e:
         logger.error(f"Error generating histogram: {e}")
         raise
 
 class NeuroAudioGenerator:
     def __init__(self):
-        self.audio_segment = AudioSegment.silent(
-            duration=Config.TOTAL_DURATION_SECONDS * 1000,
-            frame_rate=Config.SAMPLE_RATE
+        # Mono 16-bit PCM, silent until frequencies are added
+        self.pcm = np.zeros(
+            Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS,
+            dtype=np.int16
         )
 
     @staticmethod
@@ -92,54 +292,183 @@ class NeuroAudioGenerator:
         hz = thz * 1e12
         return min(max(hz, Config.MIN_FREQUENCY_HZ), Config.MAX_FREQUENCY_HZ)
 
-    def generate_tone(self, frequency_hz):
-        """Generate sine wave tone."""
-        try:
-            return Sine(frequency_hz, sample_rate=Config.SAMPLE_RATE).to_audio_segment(
-                duration=Config.TOTAL_DURATION_SECONDS * 1000,
-                volume=Config.DEFAULT_VOLUME
-            )
-        except Exception as e:
-            logger.error(f"Error generating tone: {e}")
-            raise
+    # Above this many distinct tones one inverse FFT beats direct synthesis
+    IFFT_MIN_TONES = 24
+    # Unit tones kept between requests, ~5.3 MB each (30 s of float32)
+    TONE_CACHE_SIZE = 32
+    # Samples per weighted-sum block: IFFT_MIN_TONES rows stay in L2
+    GEMV_BLOCK = 8192
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _sine_table():
+        """One period of sin(2*pi*m/N) for m = 0..N-1, N samples per clip."""
+        m = np.arange(CLIP_SAMPLES, dtype=np.float64)
+        table = np.sin(2 * np.pi * m / CLIP_SAMPLES).astype(np.float32)
+        table.flags.writeable = False
+        return table
+
+    @staticmethod
+    @lru_cache(maxsize=TONE_CACHE_SIZE)
+    def _unit_tone(bin_index):
+        """Unit sine on DFT bin `bin_index`, shared read-only between requests.
+
+        With N fixed, sin(2*pi*k*i/N) is table[(k*i) mod N]: every tone is a
+        gather from one sine table, and the integer phase is exact at any i.
+        """
+        table = NeuroAudioGenerator._sine_table()
+        if _gather_tone_numba is not None:
+            tone = _gather_tone_numba(bin_index, table)
+        else:
+            phase = np.arange(CLIP_SAMPLES, dtype=np.int64)
+            phase *= bin_index
+            phase %= CLIP_SAMPLES
+            tone = table[phase]
+        tone.flags.writeable = False
+        return tone
+
+    @staticmethod
+    def _weighted_sum(tones, weights):
+        """Sum weights[k] * tones[k] as one BLAS matrix-vector product per block."""
+        n = len(tones[0])
+        weights = np.asarray(weights, dtype=np.float32)
+        block = NeuroAudioGenerator.GEMV_BLOCK
+        basis = np.empty((len(tones), block), dtype=np.float32)
+        mix = np.empty(n, dtype=np.float32)
+
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            rows = basis[:, :stop - start]
+            for k, tone in enumerate(tones):
+                rows[k] = tone[start:stop]
+            np.dot(weights, rows, out=mix[start:stop])
+
+        return mix
+
+    @staticmethod
+    def _mix_ifft(bins, weights):
+        """Synthesize weighted sines on the DFT grid with one inverse FFT."""
+        n = Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS
+        spectrum = np.zeros(n // 2 + 1, dtype=np.complex64)
+        # irfft(-1j * n/2 at bin k) is exactly sin(2*pi*k*i/n)
+        np.add.at(spectrum, bins, np.asarray(weights) * np.complex64(-0.5j * n))
+        if cp is not None and len(bins) >= Config.GPU_MIN_TONES:
+            return cp.fft.irfft(cp.asarray(spectrum), n).astype(cp.float32).get()
+        return np.fft.irfft(spectrum, n).astype(np.float32, copy=False)
 
     def add_frequencies(self, frequencies_thz):
         """Add frequencies to audio mix."""
         total = len(frequencies_thz)
         logger.info(f"Processing {total} frequencies...")
-        
-        for i, thz in enumerate(frequencies_thz, 1):
+
+        # Same conversion as thz_to_hz, applied to the whole array at once
+        freqs_thz = np.asarray(frequencies_thz, dtype=np.float64)
+        valid = np.isfinite(freqs_thz)
+        if not valid.all():
+            logger.warning(f"{total - int(valid.sum())} invalid frequencies ignored")
+        freqs_hz = np.clip(
+            freqs_thz[valid] * 1e12,
+            Config.MIN_FREQUENCY_HZ,
+            Config.MAX_FREQUENCY_HZ
+        )
+
+        if freqs_hz.size == 0:
+            return
+
+        # Snap to the DFT grid of the clip (1 / TOTAL_DURATION_SECONDS Hz, an
+        # inaudible shift) so repeated values are synthesized only once.
+        bins = np.rint(freqs_hz * Config.TOTAL_DURATION_SECONDS).astype(np.int64)
+        unique_bins, counts = np.unique(bins, return_counts=True)
+        logger.info(f"{len(unique_bins)} unique tones")
+
+        if len(unique_bins) > self.IFFT_MIN_TONES:
+            mix = self._mix_ifft(unique_bins, counts)
+        else:
+            # Few tones: weighted sum of cached unit tones, rendered once per bin
+            tones = [self._unit_tone(bin_index) for bin_index in unique_bins.tolist()]
+            mix = self._weighted_sum(tones, counts)
+
+        # Each tone plays at DEFAULT_VOLUME; dividing by the tone count keeps
+        # the sum inside int16 range instead of clipping like overlay did.
+        mix *= Config.VOLUME_LINEAR * 32767 / len(freqs_hz)
+
+        self.pcm = self._quantize(mix)
+        logger.info(f"Progress: {len(freqs_hz)}/{total}")
+
+    @staticmethod
+    def _quantize(mix):
+        """Round a float mix to int16 PCM with triangular (TPDF) dither."""
+        rng = np.random.default_rng()
+        # Difference of two uniforms: triangular noise in (-1, 1) LSB
+        mix += rng.random(mix.shape, dtype=np.float32)
+        mix -= rng.random(mix.shape, dtype=np.float32)
+        np.rint(mix, out=mix)
+        np.clip(mix, -32768, 32767, out=mix)
+        return mix.astype(np.int16)
+
+    @staticmethod
+    def _ffmpeg_command(output):
+        """ffmpeg invocation encoding raw PCM from stdin to MP3."""
+        return [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "s16le", "-ar", str(Config.SAMPLE_RATE), "-ac", "1", "-i", "-",
+            "-b:a", Config.BIT_RATE,
+            "-metadata", "title=NeuroAudio",
+            "-metadata", "artist=NeuroAudio System",
+            "-metadata", "comment=Auto generated",
+            "-f", "mp3", output
+        ]
+
+    def iter_mp3(self, chunk_size=65536):
+        """Yield the MP3 encoding in chunks as ffmpeg produces them."""
+        proc = subprocess.Popen(
+            self._ffmpeg_command("pipe:1"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+        def feed():
             try:
-                hz = self.thz_to_hz(thz)
-                tone = self.generate_tone(hz)
-                self.audio_segment = self.audio_segment.overlay(tone)
-                
-                if i % 100 == 0 or i == total:
-                    logger.info(f"Progress: {i}/{total}")
-            except Exception as e:
-                logger.warning(f"Frequency {thz}THz ignored: {str(e)}")
-                continue
+                proc.stdin.write(self.pcm.tobytes())
+            except BrokenPipeError:
+                pass  # Client went away and ffmpeg was stopped
+            finally:
+                proc.stdin.close()
+
+        # Write stdin from a thread so ffmpeg's stdout pipe never fills up
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        try:
+            for chunk in iter(lambda: proc.stdout.read(chunk_size), b""):
+                yield chunk
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            writer.join()
+            proc.wait()
 
     def save_audio(self, output_path):
         """Export MP3 file."""
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            self.audio_segment.export(
-                output_path,
-                format="mp3",
-                bitrate=Config.BIT_RATE,
-                tags={
-                    'title': 'NeuroAudio',
-                    'artist': 'NeuroAudio System',
-                    'comment': 'Auto generated'
-                }
+            # Pipe the raw PCM straight into a single ffmpeg encode
+            subprocess.run(
+                self._ffmpeg_command(output_path),
+                input=self.pcm.tobytes(),
+                capture_output=True,
+                check=True
             )
             
             if not os.path.exists(output_path):
                 raise RuntimeError(f"File not created: {output_path}")
                 
             logger.info(f"Audio saved: {os.path.getsize(output_path)} bytes")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to save audio: {e.stderr.decode(errors='replace')}")
+            raise
         except Exception as e:
             logger.error(f"Failed to save audio: {e}")
             raise
@@ -147,7 +476,11 @@ class NeuroAudioGenerator:
 def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, output_dir="output"):
     """Generate complete PDF report."""
     try:
+        summary = compute_frequency_stats(frequencies)
+
         pdf = FPDF()
+        # Deflate page streams (fpdf2's default, made explicit)
+        pdf.set_compression(True)
         pdf.add_page()
         pdf.set_font("Arial", size=12)
 
@@ -174,8 +507,9 @@ def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, outpu
             f"Duracao do Audio: {Config.TOTAL_DURATION_SECONDS} segundos"
         ]
         
-        for item in info_items:
-            pdf.cell(200, 6, remove_accents(item), ln=True)
+        # One text block per section instead of a cell call per line
+        pdf.multi_cell(200, 6, "\n".join(remove_accents(item) for item in info_items),
+                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(10)
 
@@ -185,19 +519,21 @@ def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, outpu
         pdf.ln(5)
         
         stats = {
-            "Minima": np.min(frequencies),
-            "Maxima": np.max(frequencies),
-            "Media": np.mean(frequencies),
-            "Mediana": np.median(frequencies),
-            "Desvio Padrao": np.std(frequencies),
-            "1º Quartil (Q1)": np.percentile(frequencies, 25),
-            "3º Quartil (Q3)": np.percentile(frequencies, 75)
+            "Minima": summary["min"],
+            "Maxima": summary["max"],
+            "Media": summary["mean"],
+            "Mediana": summary["median"],
+            "Desvio Padrao": summary["std"],
+            "1º Quartil (Q1)": summary["q1"],
+            "3º Quartil (Q3)": summary["q3"]
         }
         
+        # Labels and values as two side-by-side columns
         pdf.set_font("Arial", size=10)
-        for name, value in stats.items():
-            pdf.cell(100, 6, f"{name}:", ln=False)
-            pdf.cell(100, 6, f"{float(value):.6f} THz", ln=True)
+        pdf.multi_cell(100, 6, "\n".join(f"{name}:" for name in stats),
+                       new_x=XPos.RIGHT, new_y=YPos.TOP)
+        pdf.multi_cell(100, 6, "\n".join(f"{float(value):.6f} THz" for value in stats.values()),
+                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(8)
         
@@ -217,11 +553,11 @@ def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, outpu
             "  Q1: 25% das frequencias estao abaixo deste valor",
             "  Q3: 75% das frequencias estao abaixo deste valor",
             "- AMPLITUDE: Diferenca entre o maior e menor valor (Max - Min)",
-            f"  Sua amplitude: {float(np.max(frequencies) - np.min(frequencies)):.6f} THz"
+            f"  Sua amplitude: {float(summary['max'] - summary['min']):.6f} THz"
         ]
         
-        for explanation in explanations:
-            pdf.cell(200, 4, remove_accents(explanation), ln=True)
+        pdf.multi_cell(200, 4, "\n".join(remove_accents(explanation) for explanation in explanations),
+                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(8)
 
@@ -231,30 +567,28 @@ def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, outpu
         pdf.ln(5)
         
         pdf.set_font("Arial", size=9)
-        pdf.cell(200, 4, "O histograma abaixo mostra como as frequencias estao distribuidas:", ln=True)
-        pdf.cell(200, 4, "- Barras altas = muitas frequencias naquela faixa", ln=True)
-        pdf.cell(200, 4, "- Barras baixas = poucas frequencias naquela faixa", ln=True)
-        pdf.cell(200, 4, "- Linha vermelha tracejada = media das frequencias", ln=True)
-        pdf.cell(200, 4, "- Linha verde pontilhada = mediana das frequencias", ln=True)
+        pdf.multi_cell(200, 4, "\n".join([
+            "O histograma abaixo mostra como as frequencias estao distribuidas:",
+            "- Barras altas = muitas frequencias naquela faixa",
+            "- Barras baixas = poucas frequencias naquela faixa",
+            "- Linha vermelha tracejada = media das frequencias",
+            "- Linha verde pontilhada = mediana das frequencias"
+        ]), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         pdf.ln(5)
         
         try:
-            hist_img = generate_histogram_base64(frequencies)
-            temp_img = "temp_hist.png"
-            with open(temp_img, "wb") as img_file:
-                img_file.write(base64.b64decode(hist_img))
-            
-            pdf.image(temp_img, x=10, y=pdf.get_y(), w=180)
-            pdf.ln(85)
-            os.remove(temp_img)
+            # Embedded straight from memory: no shared temp file to race on
+            hist_png = generate_histogram_png(frequencies, summary)
+            # Height follows from the PNG's aspect ratio at 180 mm wide
+            image = pdf.image(BytesIO(hist_png), x=10, y=pdf.get_y(), w=180)
+            pdf.ln(image.rendered_height)
             
             # Analysis of distribution
             pdf.set_font("Arial", 'B', 10)
             pdf.cell(200, 6, "ANALISE DA DISTRIBUICAO:", ln=True)
             pdf.set_font("Arial", size=9)
             
-            freq_array = np.array(frequencies)
-            skewness = float(np.mean(((freq_array - np.mean(freq_array)) / np.std(freq_array)) ** 3))
+            skewness = float(summary["skew"])
             
             if abs(skewness) < 0.5:
                 distribution_type = "aproximadamente simetrica"
@@ -263,14 +597,14 @@ def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, outpu
             else:
                 distribution_type = "assimetrica negativa (cauda para a esquerda)"
             
-            pdf.cell(200, 4, f"- Tipo de distribuicao: {distribution_type}", ln=True)
-            pdf.cell(200, 4, f"- Concentracao: {len(freq_array)} frequencias em {len(set(freq_array))} valores unicos", ln=True)
-            
             # Range analysis
-            q1, q3 = np.percentile(freq_array, [25, 75])
-            iqr = q3 - q1
-            pdf.cell(200, 4, f"- Amplitude interquartil (IQR): {float(iqr):.6f} THz", ln=True)
-            pdf.cell(200, 4, "  (50% dos dados estao dentro desta faixa)", ln=True)
+            iqr = summary["q3"] - summary["q1"]
+            pdf.multi_cell(200, 4, "\n".join([
+                f"- Tipo de distribuicao: {distribution_type}",
+                f"- Concentracao: {summary['count']} frequencias em {summary['unique']} valores unicos",
+                f"- Amplitude interquartil (IQR): {float(iqr):.6f} THz",
+                "  (50% dos dados estao dentro desta faixa)"
+            ]), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             
         except Exception as e:
             logger.error(f"Histogram error: {e}")
@@ -287,13 +621,161 @@ def generate_pdf_report(frequencies, pdf_filename, aroma_id, company_name, outpu
         # Save PDF
         os.makedirs(output_dir, exist_ok=True)
         pdf_path = os.path.join(output_dir, pdf_filename)
-        pdf.output(pdf_path)
+        # Serialize in memory, then write the whole document in one call
+        pdf_bytes = pdf.output()
+        with open(pdf_path, "wb") as pdf_file:
+            pdf_file.write(pdf_bytes)
         
         return pdf_path
     except Exception as e:
         logger.error(f"PDF error: {e}")
         raise
 
+async def read_frequencies(source):
+    """Read and validate the THz column of an uploaded Excel file object."""
+    try:
+        # Only the THz column is converted into a DataFrame
+        df = await run_in_threadpool(
+            pd.read_excel,
+            source,
+            engine=Config.EXCEL_ENGINE,
+            usecols=lambda column: column == Config.REQUIRED_EXCEL_COLUMN
+        )
+        
+        # Check if THz column exists
+        if Config.REQUIRED_EXCEL_COLUMN not in df.columns:
+            raise ValueError(f"Coluna '{Config.REQUIRED_EXCEL_COLUMN}' não encontrada no arquivo")
+        
+        # Check if file is empty
+        if df.empty:
+            raise ValueError("Arquivo Excel está vazio")
+        
+        # Get frequencies and validate
+        frequencies = df[Config.REQUIRED_EXCEL_COLUMN].dropna()
+        
+        # Check if there are any frequencies
+        if frequencies.empty:
+            raise ValueError("Nenhuma frequência válida encontrada na coluna THz")
+        
+        # Non-numeric values become NaN and fail the positivity check
+        frequencies = pd.to_numeric(frequencies, errors="coerce").to_numpy(dtype=np.float64)
+        frequencies = frequencies[frequencies > 0]
+        
+        if frequencies.size == 0:
+            raise ValueError("Nenhuma frequência numérica válida encontrada (valores devem ser positivos)")
+        
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Erro no arquivo Excel: {str(e)}")
+
+    return frequencies
+
+async def read_frequencies_arrow(source):
+    """Read and validate the THz column of an Arrow IPC file object."""
+    if pa is None:
+        raise HTTPException(status_code=415, detail="Arrow uploads are not supported by this server")
+    try:
+        table = pa.ipc.open_file(source).read_all()
+        if Config.REQUIRED_EXCEL_COLUMN not in table.column_names:
+            raise ValueError(f"Coluna '{Config.REQUIRED_EXCEL_COLUMN}' não encontrada no arquivo")
+
+        # Nulls become NaN and, like non-positive values, are dropped
+        frequencies = table.column(Config.REQUIRED_EXCEL_COLUMN).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        frequencies = frequencies[frequencies > 0]
+
+        if frequencies.size == 0:
+            raise ValueError("Nenhuma frequência numérica válida encontrada (valores devem ser positivos)")
+
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Erro no arquivo Arrow: {str(e)}")
+
+    return frequencies
+
+# Upload formats accepted by /jobs, and the reader for each
+FREQUENCY_READERS = {"excel": read_frequencies, "arrow": read_frequencies_arrow}
+
+async def run_audio_job(content, company_name, progress=None, reader=read_frequencies):
+    """Generate the MP3 for an uploaded Excel (or Arrow) file, reporting each stage."""
+    def report(pct, stage):
+        if progress is not None:
+            progress(pct, stage)
+
+    # Generate IDs
+    aroma_id = uuid.uuid4().hex[:8].upper()
+    output_dir = os.path.join("output", remove_accents(company_name))
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Same bytes for the same company: the earlier result still applies
+    cache_key = (content_digest(content), company_name)
+    cached = processed_jobs.get(cache_key)
+    if cached and os.path.exists(os.path.join(cached["output_dir"], cached["audio_file"])):
+        logger.info(f"Reusing job {cached['aroma_id']} for identical upload")
+        processed_jobs.move_to_end(cache_key)
+        return cached
+
+    # Process Excel
+    report(10, "reading")
+    frequencies = await reader(BytesIO(content))
+
+    # Generate Audio
+    audio_filename = f"NeuroAudio_{company_name}_{aroma_id}.mp3"
+    audio_path = os.path.join(output_dir, audio_filename)
+    
+    try:
+        # Synthesis and encoding block, so keep them off the event loop
+        generator = NeuroAudioGenerator()
+        report(30, "generating")
+        await run_in_threadpool(generator.add_frequencies, frequencies)
+        report(70, "encoding")
+        await run_in_threadpool(generator.save_audio, audio_path)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Audio error: {str(e)}")
+
+    result = {
+        "status": "success",
+        "audio_file": audio_filename,
+        "aroma_id": aroma_id,
+        "output_dir": output_dir,
+        "frequencies_processed": len(frequencies)
+    }
+    processed_jobs[cache_key] = result
+    processed_jobs.move_to_end(cache_key)
+    if len(processed_jobs) > Config.PROCESSED_JOBS_SIZE:
+        processed_jobs.popitem(last=False)
+    return result
+
+def prune_background_jobs():
+    """Forget background jobs that finished more than Config.JOB_TTL_SECONDS ago."""
+    cutoff = time.monotonic() - Config.JOB_TTL_SECONDS
+    expired = [job_id for job_id, job in background_jobs.items() if job.get("finished_at", cutoff) < cutoff]
+    for job_id in expired:
+        del background_jobs[job_id]
+
+def update_job(job_id, **state):
+    """Record background job progress and wake up everyone watching it."""
+    job = background_jobs[job_id]
+    job["state"].update(state)
+    job["version"] += 1
+    if job["state"]["done"]:
+        job["finished_at"] = time.monotonic()
+    changed, job["changed"] = job["changed"], asyncio.Event()
+    changed.set()
+
+async def run_background_job(job_id, content, company_name, reader=read_frequencies):
+    """Run an audio job started through /jobs, storing its outcome."""
+    try:
+        result = await run_audio_job(
+            content,
+            company_name,
+            progress=lambda pct, stage: update_job(job_id, pct=pct, stage=stage),
+            reader=reader
+        )
+        update_job(job_id, pct=100, stage="done", done=True, result=result)
+    except HTTPException as e:
+        update_job(job_id, stage="failed", done=True, error=e.detail)
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {str(e)}")
+        update_job(job_id, stage="failed", done=True, error=f"Internal error: {str(e)}")
+
 @app.post("/process-audio")
 async def process_audio(
     file: UploadFile = File(...),
@@ -301,77 +783,104 @@ async def process_audio(
 ):
     """Process Excel file and generate audio + report"""
     try:
-        # Generate IDs
-        aroma_id = uuid.uuid4().hex[:8].upper()
-        output_dir = os.path.join("output", remove_accents(company_name))
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Process Excel
-        try:
-            df = pd.read_excel(file.file)
-            
-            # Check if file is empty
-            if df.empty:
-                raise ValueError("Arquivo Excel está vazio")
-            
-            # Check if THz column exists
-            if Config.REQUIRED_EXCEL_COLUMN not in df.columns:
-                raise ValueError(f"Coluna '{Config.REQUIRED_EXCEL_COLUMN}' não encontrada no arquivo")
-            
-            # Get frequencies and validate
-            frequencies = df[Config.REQUIRED_EXCEL_COLUMN].dropna().tolist()
-            
-            # Check if there are any frequencies
-            if not frequencies:
-                raise ValueError("Nenhuma frequência válida encontrada na coluna THz")
-            
-            # Check minimum number of frequencies
-            if len(frequencies) < 1:
-                raise ValueError("É necessário pelo menos 1 frequência para gerar áudio")
-            
-            # Validate that frequencies are numeric
-            numeric_frequencies = []
-            for freq in frequencies:
-                try:
-                    numeric_freq = float(freq)
-                    if numeric_freq <= 0:
-                        continue  # Skip zero or negative frequencies
-                    numeric_frequencies.append(numeric_freq)
-                except (ValueError, TypeError):
-                    continue  # Skip non-numeric values
-            
-            if not numeric_frequencies:
-                raise ValueError("Nenhuma frequência numérica válida encontrada (valores devem ser positivos)")
-            
-            frequencies = numeric_frequencies
-            
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Erro no arquivo Excel: {str(e)}")
+        content = await file.read()
+        return await run_audio_job(content, company_name)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"General error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
-        # Generate Audio
-        audio_filename = f"NeuroAudio_{company_name}_{aroma_id}.mp3"
-        audio_path = os.path.join(output_dir, audio_filename)
-        
-        try:
-            generator = NeuroAudioGenerator()
-            generator.add_frequencies(frequencies)
-            generator.save_audio(audio_path)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Audio error: {str(e)}")
-
-        return {
-            "status": "success",
-            "audio_file": audio_filename,
-            "aroma_id": aroma_id,
-            "output_dir": output_dir,
-            "frequencies_processed": len(frequencies)
-        }
+@app.post("/process-audio-arrow")
+async def process_audio_arrow(
+    file: UploadFile = File(...),
+    company_name: str = Form("Client")
+):
+    """Process an Arrow IPC file holding only the THz column and generate audio"""
+    try:
+        content = await file.read()
+        return await run_audio_job(content, company_name, reader=read_frequencies_arrow)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"General error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
+@app.post("/jobs")
+async def create_job(
+    file: UploadFile = File(...),
+    company_name: str = Form("Client"),
+    upload_format: str = Form("excel", alias="format")
+):
+    """Start processing in the background and return its job id"""
+    if upload_format not in FREQUENCY_READERS:
+        raise HTTPException(status_code=400, detail=f"Unknown upload format: {upload_format}")
+    # Refuse Arrow before queueing, so clients can resend the workbook
+    # instead of watching the job fail
+    if upload_format == "arrow" and pa is None:
+        raise HTTPException(status_code=415, detail="Arrow uploads are not supported by this server")
+    content = await file.read()
+    prune_background_jobs()
+    job_id = uuid.uuid4().hex
+    background_jobs[job_id] = {
+        "state": {"pct": 0, "stage": "queued", "done": False},
+        "version": 0,
+        "changed": asyncio.Event()
+    }
+    background_jobs[job_id]["task"] = asyncio.create_task(
+        run_background_job(job_id, content, company_name, FREQUENCY_READERS[upload_format])
+    )
+    return {"job_id": job_id}
+
+@app.get("/events/{job_id}")
+async def job_events(job_id: str):
+    """Server-Sent Events stream of a background job's progress"""
+    if job_id not in background_jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def stream():
+        while True:
+            job = background_jobs[job_id]
+            # Take the event before reading state so no update is missed
+            changed = job["changed"]
+            state = dict(job["state"])
+            yield f"data: {json.dumps(state)}\n\n"
+            if state["done"]:
+                break
+            await changed.wait()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/process-audio/stream")
+async def process_audio_stream(
+    file: UploadFile = File(...),
+    company_name: str = Form("Client")
+):
+    """Process Excel file and stream the MP3 back while it is encoded"""
+    aroma_id = uuid.uuid4().hex[:8].upper()
+    frequencies = await read_frequencies(file.file)
+
+    try:
+        generator = NeuroAudioGenerator()
+        await run_in_threadpool(generator.add_frequencies, frequencies)
+    except Exception as e:
+        logger.error(f"Audio error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Audio error: {str(e)}")
+
+    audio_filename = f"NeuroAudio_{remove_accents(company_name)}_{aroma_id}.mp3"
+    return StreamingResponse(
+        generator.iter_mp3(),
+        media_type="audio/mpeg",
+        headers={
+            "Content-Disposition": f'attachment; filename="{audio_filename}"',
+            "X-Aroma-Id": aroma_id
+        }
+    )
+
 @app.get("/download/{file_type}/{company_name}/{filename}")
 async def download_file(file_type: str, company_name: str, filename: str):
     """Download generated files"""
@@ -391,6 +900,47 @@ async def download_file(file_type: str, company_name: str, filename: str):
         filename=filename
     )
 
+@app.get("/jobs/{job_id}/status")
+async def job_status(job_id: str, version: int = -1):
+    """Long-poll a background job: answers as soon as its state is newer than ``version``, or after 25 s"""
+    if job_id not in background_jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    job = background_jobs[job_id]
+    if job["version"] == version and not job["state"]["done"]:
+        try:
+            await asyncio.wait_for(job["changed"].wait(), timeout=25)
+        except asyncio.TimeoutError:
+            pass
+    return {**job["state"], "version": job["version"]}
+
+@app.websocket("/ws/{job_id}")
+async def job_websocket(websocket: WebSocket, job_id: str):
+    """Push a background job's stage transitions and final result over a WebSocket"""
+    await websocket.accept()
+    if job_id not in background_jobs:
+        await websocket.send_json({"type": "error", "detail": "Job not found"})
+        await websocket.close()
+        return
+
+    try:
+        while True:
+            job = background_jobs[job_id]
+            changed = job["changed"]
+            state = dict(job["state"])
+            if not state["done"]:
+                await websocket.send_json({"type": "progress", **state})
+            elif "result" in state:
+                await websocket.send_json({"type": "done", **state})
+                break
+            else:
+                await websocket.send_json({"type": "error", "detail": state["error"], **state})
+                break
+            await changed.wait()
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
 @app.get("/job-status/{job_id}")
 async def get_job_status(job_id: str):
     """Job status endpoint"""
@@ -407,6 +957,12 @@ async def root():
         "message": "NeuroAudio API - Audio and Report Generation",
         "endpoints": {
             "/process-audio (POST)": "Process Excel file and generate audio + PDF",
+            "/process-audio/stream (POST)": "Process Excel file and stream the MP3 directly",
+            "/process-audio-arrow (POST)": "Process an Arrow IPC file with the THz column",
+            "/jobs (POST)": "Start processing in the background (format=excel|arrow), returns a job id",
+            "/events/{job_id} (GET)": "Server-Sent Events with the job's progress",
+            "/ws/{job_id} (WebSocket)": "Job progress and final result pushed over a WebSocket",
+            "/jobs/{job_id}/status?version= (GET)": "Long-poll the job's progress",
             "/download/{audio|report}/{company}/{filename} (GET)": "Download files"
         }
     }
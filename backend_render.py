@@ -1,18 +1,20 @@
 import os
-import datetime
 import numpy as np
 import logging
+from functools import lru_cache
 import unicodedata
-import matplotlib.pyplot as plt
-from io import BytesIO
-import base64
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
 from pydub import AudioSegment
-from pydub.generators import Sine
 import uuid
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the NumPy mixer is used instead
+    njit = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,20 +25,47 @@ app = FastAPI(title="NeuroAudio Processing API")
 class Config:
     TOTAL_DURATION_SECONDS = 30
     DEFAULT_VOLUME = -10
+    VOLUME_LINEAR = 10 ** (DEFAULT_VOLUME / 20)
     MIN_FREQUENCY_HZ = 18000
     MAX_FREQUENCY_HZ = 22000
     SAMPLE_RATE = 44100
     BIT_RATE = "192k"
     REQUIRED_EXCEL_COLUMN = "THz"
 
+@lru_cache(maxsize=1024)
+def _strip_accents(text):
+    """NFD-decompose and drop everything outside ASCII; the same company names come back across requests."""
+    normalized = unicodedata.normalize('NFD', text)
+    return normalized.encode('ascii', 'ignore').decode('ascii')
+
 def remove_accents(text):
     """Remove accents and special characters."""
     if isinstance(text, str):
-        normalized = unicodedata.normalize('NFD', text)
-        ascii_text = normalized.encode('ascii', 'ignore').decode('ascii')
-        return ascii_text.replace('ç', 'c').replace('Ç', 'C')
+        return text if text.isascii() else _strip_accents(text)
     return str(text)
 
+if njit is not None:
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True)
+    def _mix_numba(steps, weights, table, n):
+        """Sum weighted tones sample by sample, in parallel over samples.
+
+        Each tone is a table read at the integer phase (steps[j] * i) mod
+        len(table); the table length is a power of two, so mod is a mask.
+        """
+        mask = table.shape[0] - 1
+        buf = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            s = 0.0
+            for j in range(steps.shape[0]):
+                s += weights[j] * table[(steps[j] * i) & mask]
+            buf[i] = s
+        return buf
+
+    # Compile (or load from the on-disk cache) at import, not on the first request
+    _mix_numba(np.zeros(1, np.int64), np.ones(1), np.zeros(2, np.float32), 1)
+else:
+    _mix_numba = None
+
 class NeuroAudioGenerator:
     def __init__(self):
         self.audio_segment = AudioSegment.silent(
@@ -52,33 +81,84 @@ class NeuroAudioGenerator:
         hz = thz * 1e12
         return min(max(hz, Config.MIN_FREQUENCY_HZ), Config.MAX_FREQUENCY_HZ)
 
-    def generate_tone(self, frequency_hz):
-        """Generate sine wave tone."""
-        try:
-            return Sine(frequency_hz, sample_rate=Config.SAMPLE_RATE).to_audio_segment(
-                duration=Config.TOTAL_DURATION_SECONDS * 1000,
-                volume=Config.DEFAULT_VOLUME
-            )
-        except Exception as e:
-            logger.error(f"Error generating tone: {e}")
-            raise
+    # Frequencies mixed per block and samples per block; bounds the
+    # (frequencies x samples) phase matrix to a few tens of MB.
+    FREQ_CHUNK = 64
+    SAMPLE_BLOCK = 1 << 16
+
+    # One sine period over 2^20 points: a tone becomes table reads stepped by
+    # an integer phase increment (f * TABLE / SR) instead of sin calls; the
+    # frequency resolution is SR / 2^20, about 0.04 Hz
+    SINE_TABLE_SIZE = 1 << 20
+    _SINE_TABLE = np.sin(2 * np.pi * np.arange(SINE_TABLE_SIZE) / SINE_TABLE_SIZE).astype(np.float32)
+    _SINE_TABLE.flags.writeable = False
+    # Sample index of the NumPy mixer, built once per process
+    _SAMPLE_INDEX = np.arange(Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS, dtype=np.int64)
+    _SAMPLE_INDEX.flags.writeable = False
+
+    @staticmethod
+    def _mix(freqs_hz, weights):
+        """Sum tones of the given amplitudes into a single float32 buffer."""
+        n = Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS
+        table = NeuroAudioGenerator._SINE_TABLE
+        mask = NeuroAudioGenerator.SINE_TABLE_SIZE - 1
+        # Integer phase steps: (step * i) & mask is exact at every sample
+        steps = np.rint(freqs_hz * NeuroAudioGenerator.SINE_TABLE_SIZE / Config.SAMPLE_RATE).astype(np.int64)
+        weights = weights.astype(np.float64)
+        if _mix_numba is not None:
+            return _mix_numba(steps, weights, table, n)
+
+        buf = np.zeros(n, dtype=np.float32)
+        for start in range(0, n, NeuroAudioGenerator.SAMPLE_BLOCK):
+            i_block = NeuroAudioGenerator._SAMPLE_INDEX[start:start + NeuroAudioGenerator.SAMPLE_BLOCK]
+            out = buf[start:start + NeuroAudioGenerator.SAMPLE_BLOCK]
+            for j in range(0, len(steps), NeuroAudioGenerator.FREQ_CHUNK):
+                phase = steps[j:j + NeuroAudioGenerator.FREQ_CHUNK, None] * i_block[None, :]
+                phase &= mask
+                w = weights[j:j + NeuroAudioGenerator.FREQ_CHUNK]
+                out += w @ table[phase]
+
+        return buf
 
     def add_frequencies(self, frequencies_thz):
         """Add frequencies to audio mix."""
         total = len(frequencies_thz)
         logger.info(f"Processing {total} frequencies...")
-        
-        for i, thz in enumerate(frequencies_thz, 1):
-            try:
-                hz = self.thz_to_hz(thz)
-                tone = self.generate_tone(hz)
-                self.audio_segment = self.audio_segment.overlay(tone)
-                
-                if i % 100 == 0 or i == total:
-                    logger.info(f"Progress: {i}/{total}")
-            except Exception as e:
-                logger.warning(f"Frequency {thz}THz ignored: {str(e)}")
-                continue
+
+        # Same conversion as thz_to_hz, applied to the whole array at once
+        freqs_thz = np.asarray(frequencies_thz, dtype=np.float64)
+        valid = np.isfinite(freqs_thz)
+        if not valid.all():
+            logger.warning(f"{total - int(valid.sum())} invalid frequencies ignored")
+        freqs_hz = np.clip(
+            freqs_thz[valid] * 1e12,
+            Config.MIN_FREQUENCY_HZ,
+            Config.MAX_FREQUENCY_HZ
+        )
+
+        if freqs_hz.size == 0:
+            return
+
+        # One synthesis pass instead of a Sine segment and an overlay copy per
+        # frequency; each tone plays at DEFAULT_VOLUME and dividing by the tone
+        # count keeps the sum inside int16 range instead of clipping like overlay.
+        # Clipping and repeated Excel rows make many entries land on the same
+        # tone: synthesize each distinct one (0.1 Hz steps) once, weighted by
+        # how often it occurs
+        unique_hz, counts = np.unique(np.round(freqs_hz, 1), return_counts=True)
+        mix = self._mix(unique_hz, counts)
+        mix *= Config.VOLUME_LINEAR * 32767 / len(freqs_hz)
+        np.rint(mix, out=mix)
+        np.clip(mix, -32768, 32767, out=mix)
+        pcm = mix.astype("<i2")
+
+        self.audio_segment = AudioSegment(
+            data=pcm.tobytes(),
+            sample_width=2,
+            frame_rate=Config.SAMPLE_RATE,
+            channels=1
+        )
+        logger.info(f"Progress: {len(freqs_hz)}/{total}")
 
     def save_audio(self, output_path):
         """Export MP3 file."""
@@ -116,9 +196,9 @@ async def process_audio(
         output_dir = os.path.join("output", remove_accents(company_name))
         os.makedirs(output_dir, exist_ok=True)
 
-        # Process Excel
+        # Process Excel, parsing the spooled upload off the event loop
         try:
-            df = pd.read_excel(file.file)
+            df = await run_in_threadpool(pd.read_excel, file.file)
             
             # Check if file is empty
             if df.empty:
@@ -1,17 +1,22 @@
 import os
+import importlib.util
+import math
+from functools import lru_cache
 import logging
 import unicodedata
-from typing import List
-from io import BytesIO
-import base64
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
 import numpy as np
-import io
 import wave
 import uuid
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the NumPy mixer is used instead
+    njit = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,11 +24,18 @@ logger = logging.getLogger(__name__)
 class Config:
     TOTAL_DURATION_SECONDS = 30
     DEFAULT_VOLUME = -10
+    VOLUME_LINEAR = 10 ** (DEFAULT_VOLUME / 20)
     MIN_FREQUENCY_HZ = 18000
     MAX_FREQUENCY_HZ = 22000
     SAMPLE_RATE = 44100
     BIT_RATE = "192k"
     REQUIRED_EXCEL_COLUMN = "THz"
+    # Rust-based reader when python-calamine is installed, pandas' default otherwise
+    EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+    # Optional on-disk bank of rendered unit tones, memory-mapped on reuse
+    TONE_BANK_DIR = os.environ.get("TONE_BANK_DIR")
+    # Bank size cap in tones (~5 MB each); least recently used files go first
+    TONE_BANK_MAX_TONES = int(os.environ.get("TONE_BANK_MAX_TONES", 256))
 
 def remove_accents(text):
     """Remove accents and special characters."""
@@ -33,6 +45,39 @@ def remove_accents(text):
         return ascii_text.replace('ç', 'c').replace('Ç', 'C')
     return str(text)
 
+if njit is not None:
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True)
+    def _mix_numba(omegas, weights, n):
+        """Sum weighted sines over time blocks in parallel.
+
+        `omegas` are radians per sample. Inside a block each oscillator is
+        a rotation, (x, y) <- (c*x - s*y, s*x + c*y), so a sample costs four
+        multiply-adds instead of a sin; every block restarts from an exact
+        sin/cos of its first sample, which bounds the drift to 4096 steps.
+        """
+        block = 4096
+        buf = np.empty(n, dtype=np.float32)
+        for b in prange((n + block - 1) // block):
+            lo = b * block
+            hi = min(lo + block, n)
+            acc = np.zeros(hi - lo)
+            for k in range(omegas.shape[0]):
+                w = omegas[k]
+                c = math.cos(w)
+                s = math.sin(w)
+                x = weights[k] * math.cos(w * lo)
+                y = weights[k] * math.sin(w * lo)
+                for i in range(hi - lo):
+                    acc[i] += y
+                    x, y = c * x - s * y, s * x + c * y
+            buf[lo:hi] = acc
+        return buf
+
+    # Compile (or load from the on-disk cache) at import, not on the first request
+    _mix_numba(np.zeros(1), np.ones(1), 1)
+else:
+    _mix_numba = None
+
 class NeuroAudioGenerator:
     def __init__(self):
         self.audio_data = None
@@ -45,49 +90,146 @@ class NeuroAudioGenerator:
         hz = thz * 1e12
         return min(max(hz, Config.MIN_FREQUENCY_HZ), Config.MAX_FREQUENCY_HZ)
     
-    def generate_tone(self, frequency_hz, duration_seconds):
-        """Generate sine wave tone using numpy."""
-        t = np.linspace(0, duration_seconds, int(Config.SAMPLE_RATE * duration_seconds), False)
-        sine_wave = np.sin(2 * np.pi * frequency_hz * t)
-        
-        # Apply volume (convert from dB to linear scale)
-        volume_linear = 10 ** (Config.DEFAULT_VOLUME / 20)
-        sine_wave = sine_wave * volume_linear
-        
-        # Convert to 16-bit PCM
-        audio_data = (sine_wave * 32767).astype(np.int16)
-        return audio_data
+    # Frequencies mixed per block and samples per block; bounds the
+    # (frequencies x samples) phase matrix to a few tens of MB.
+    FREQ_CHUNK = 64
+    SAMPLE_BLOCK = 1 << 16
+    # Mixes with at most CACHED_MAX_TONES distinct tones are summed from
+    # cached unit tones (~5 MB each, TONE_CACHE_SIZE kept across requests)
+    CACHED_MAX_TONES = 24
+    TONE_CACHE_SIZE = 32
+    # Angular time base 2*pi*t of the NumPy mixer, built once per process.
+    # Phases stay in float64: a 22 kHz tone reaches ~4e6 rad after 30 s,
+    # well beyond float32 precision.
+    _TWO_PI_T = 2 * np.pi * np.arange(int(Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS), dtype=np.float64) / Config.SAMPLE_RATE
+    _TWO_PI_T.flags.writeable = False
+    
+    @staticmethod
+    @lru_cache(maxsize=TONE_CACHE_SIZE)
+    def _unit_tone(frequency_hz):
+        """Unit sine at `frequency_hz`, shared read-only between requests.
+
+        Keyed on the exact frequency: rounding the key would shift the tone
+        and drift its phase by up to radians over the clip. With
+        TONE_BANK_DIR set, renders persist there (at most
+        TONE_BANK_MAX_TONES files) and later processes map them read-only
+        instead of synthesizing again.
+        """
+        if Config.TONE_BANK_DIR:
+            path = os.path.join(Config.TONE_BANK_DIR, f"{float(frequency_hz).hex()}.npy")
+            try:
+                tone = np.load(path, mmap_mode='r')
+                # The mtime marks recent use for eviction
+                os.utime(path)
+                return tone
+            except FileNotFoundError:
+                pass  # Not banked yet, or evicted meanwhile
+        
+        tone = NeuroAudioGenerator._mix([frequency_hz], [1.0])
+        tone.flags.writeable = False
+        
+        if Config.TONE_BANK_DIR:
+            # Write aside and rename, so readers never map a partial file
+            os.makedirs(Config.TONE_BANK_DIR, exist_ok=True)
+            partial = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(partial, 'wb') as bank_file:
+                np.save(bank_file, tone)
+            os.replace(partial, path)
+            NeuroAudioGenerator._evict_tone_bank()
+        return tone
+    
+    @staticmethod
+    def _evict_tone_bank():
+        """Delete the least recently used bank files beyond TONE_BANK_MAX_TONES."""
+        entries = []
+        with os.scandir(Config.TONE_BANK_DIR) as scan:
+            for entry in scan:
+                if entry.name.endswith('.npy'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except FileNotFoundError:
+                        continue
+        entries.sort()
+        for _, path in entries[:max(len(entries) - Config.TONE_BANK_MAX_TONES, 0)]:
+            # Tones already mapped stay valid after the unlink
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Another worker evicted it first
+    
+    @staticmethod
+    def _mix(freqs_hz, weights):
+        """Sum sines of the given amplitudes into a single float32 buffer."""
+        n = int(Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS)
+        weights = np.asarray(weights, dtype=np.float64)
+        if _mix_numba is not None:
+            return _mix_numba(2 * np.pi * np.asarray(freqs_hz, dtype=np.float64) / Config.SAMPLE_RATE, weights, n)
+        
+        freqs_hz = np.asarray(freqs_hz, dtype=np.float64)
+        # One output accumulator and one reusable phase scratch: peak memory
+        # stays O(N) however many frequencies come in, and no per-block
+        # phase or sine arrays are allocated
+        combined = np.zeros(n, dtype=np.float32)
+        scratch = np.empty((NeuroAudioGenerator.FREQ_CHUNK, NeuroAudioGenerator.SAMPLE_BLOCK))
+        
+        for start in range(0, n, NeuroAudioGenerator.SAMPLE_BLOCK):
+            two_pi_t = NeuroAudioGenerator._TWO_PI_T[start:start + NeuroAudioGenerator.SAMPLE_BLOCK]
+            out = combined[start:start + NeuroAudioGenerator.SAMPLE_BLOCK]
+            for j in range(0, len(freqs_hz), NeuroAudioGenerator.FREQ_CHUNK):
+                chunk = freqs_hz[j:j + NeuroAudioGenerator.FREQ_CHUNK]
+                w = weights[j:j + NeuroAudioGenerator.FREQ_CHUNK]
+                phase = scratch[:len(chunk), :len(two_pi_t)]
+                np.multiply(chunk[:, None], two_pi_t[None, :], out=phase)
+                np.sin(phase, out=phase)
+                np.add(out, w @ phase, out=out, casting='same_kind')
+        
+        return combined
     
     def add_frequencies(self, frequencies_thz):
         """Add frequencies to audio mix."""
         total = len(frequencies_thz)
         logger.info(f"Processing {total} frequencies...")
         
-        combined_audio = None
+        # Same conversion as thz_to_hz, applied to the whole array at once;
+        # non-numeric entries become NaN and are dropped with the rest
+        freqs_thz = np.asarray(pd.to_numeric(frequencies_thz, errors="coerce"), dtype=np.float64)
+        valid = np.isfinite(freqs_thz) & (freqs_thz > 0)
+        if not valid.all():
+            logger.warning(f"Skipping {total - int(valid.sum())} invalid frequencies")
+        hz = np.clip(freqs_thz[valid] * 1e12, Config.MIN_FREQUENCY_HZ, Config.MAX_FREQUENCY_HZ)
+        # Map to audible range
+        mapped = ((hz - Config.MIN_FREQUENCY_HZ) % (Config.MAX_FREQUENCY_HZ - Config.MIN_FREQUENCY_HZ)) + Config.MIN_FREQUENCY_HZ
+        logger.info(f"Progress: {len(mapped)}/{total}")
         
-        for i, thz in enumerate(frequencies_thz, 1):
-            try:
-                hz = self.thz_to_hz(thz)
-                # Map to audible range
-                mapped_hz = ((hz - Config.MIN_FREQUENCY_HZ) % (Config.MAX_FREQUENCY_HZ - Config.MIN_FREQUENCY_HZ)) + Config.MIN_FREQUENCY_HZ
-                
-                tone = self.generate_tone(mapped_hz, Config.TOTAL_DURATION_SECONDS)
-                
-                if combined_audio is None:
-                    combined_audio = tone.astype(np.float32)
-                else:
-                    combined_audio = combined_audio + tone.astype(np.float32)
-                
-                if i % 100 == 0 or i == total:
-                    logger.info(f"Progress: {i}/{total}")
-            except Exception as e:
-                logger.warning(f"Skipping frequency {thz}: {e}")
-        
-        # Normalize to prevent clipping
-        if combined_audio is not None:
-            max_val = np.max(np.abs(combined_audio))
-            if max_val > 32767:
-                combined_audio = (combined_audio / max_val * 32767)
+        if mapped.size:
+            # Clamping to the band and repeated rows make many entries land on
+            # the same tone; summing k identical sines is exactly one sine of
+            # amplitude k, so each distinct frequency is synthesized once. No
+            # rounding grid: a 0.01 Hz step drifts up to ~1 rad over 30 s
+            freqs_unique, counts = np.unique(mapped, return_counts=True)
+            
+            if len(freqs_unique) <= self.CACHED_MAX_TONES:
+                # Few tones (the usual repeat sheet): sum cached renders
+                combined_audio = np.zeros(int(Config.SAMPLE_RATE * Config.TOTAL_DURATION_SECONDS), dtype=np.float32)
+                for frequency_hz, count in zip(freqs_unique.tolist(), counts.tolist()):
+                    tone = self._unit_tone(frequency_hz)
+                    combined_audio += tone if count == 1 else np.float32(count) * tone
+            else:
+                # All tones in one broadcast pass
+                combined_audio = self._mix(freqs_unique, counts)
+            
+            # Volume, int16 scale and the anti-clipping normalization fold
+            # into one factor, so the float32 mix is scaled in a single pass
+            # and quantized once at the end
+            scale = Config.VOLUME_LINEAR * 32767
+            # Peak from the two extremes: no full-size abs() temporary
+            max_val = max(float(combined_audio.max()), -float(combined_audio.min()))
+            if max_val * scale > 32767:
+                # Normalize to prevent clipping
+                scale = 32767 / max_val
+            np.multiply(combined_audio, np.float32(scale), out=combined_audio)
+            # float32 rounding can land the peak just past 32767
+            np.clip(combined_audio, -32768, 32767, out=combined_audio)
             
             self.audio_data = combined_audio.astype(np.int16)
         
@@ -100,7 +242,15 @@ class NeuroAudioGenerator:
                 wav_file.setnchannels(1)  # Mono
                 wav_file.setsampwidth(2)  # 16-bit
                 wav_file.setframerate(Config.SAMPLE_RATE)
-                wav_file.writeframes(self.audio_data.tobytes())
+                # The finished PCM goes out in one write, as a byte view
+                # rather than a tobytes() copy
+                wav_file.writeframes(memoryview(self.audio_data).cast('B'))
+
+def render_audio(frequencies, audio_path):
+    """Synthesize the mix for `frequencies` and write it to `audio_path`."""
+    generator = NeuroAudioGenerator()
+    generator.add_frequencies(frequencies)
+    generator.save_audio(audio_path)
 
 # Initialize FastAPI
 app = FastAPI(title="NeuroAudio API", version="1.0.0")
@@ -117,9 +267,15 @@ async def process_audio(
     try:
         job_id = str(uuid.uuid4())
         
-        # Read Excel file
-        content = await file.read()
-        df = pd.read_excel(BytesIO(content))
+        # Read Excel file straight from the spooled upload (no in-memory
+        # copy of the body), parsing in a worker thread off the event loop.
+        # Only the THz column is converted into a DataFrame
+        df = await run_in_threadpool(
+            pd.read_excel,
+            file.file,
+            engine=Config.EXCEL_ENGINE,
+            usecols=lambda column: column == Config.REQUIRED_EXCEL_COLUMN
+        )
         
         # Validate required column
         if Config.REQUIRED_EXCEL_COLUMN not in df.columns:
@@ -129,19 +285,16 @@ async def process_audio(
             )
         
         # Extract and validate frequencies
-        frequencies = df[Config.REQUIRED_EXCEL_COLUMN].dropna().tolist()
+        # Non-numeric values become NaN and fail the positivity check
+        frequencies = pd.to_numeric(df[Config.REQUIRED_EXCEL_COLUMN], errors="coerce").to_numpy(dtype=np.float64)
+        frequencies = frequencies[np.isfinite(frequencies) & (frequencies > 0)]
         
-        if not frequencies:
+        if frequencies.size == 0:
             raise HTTPException(
                 status_code=400,
                 detail="No valid frequency data found"
             )
         
-        # Generate audio
-        logger.info(f"Starting audio generation for {len(frequencies)} frequencies")
-        generator = NeuroAudioGenerator()
-        generator.add_frequencies(frequencies)
-        
         # Create output directory
         output_dir = "output"
         os.makedirs(output_dir, exist_ok=True)
@@ -151,8 +304,11 @@ async def process_audio(
         audio_filename = f"{safe_company}_neuroaudio_{job_id[:8]}.wav"
         audio_path = os.path.join(output_dir, audio_filename)
         
-        # Save audio
-        generator.save_audio(audio_path)
+        # Generate and save audio in a worker thread: the mixers run without
+        # the GIL (NumPy ufuncs, nogil Numba kernel), so the event loop keeps
+        # serving and concurrent uploads synthesize in parallel
+        logger.info(f"Starting audio generation for {len(frequencies)} frequencies")
+        await run_in_threadpool(render_audio, frequencies, audio_path)
         
         # Store job result
         processed_files[job_id] = {
@@ -0,0 +1,638 @@
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.filepost import encode_multipart_formdata
+import json
+import time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import zlib
+try:
+    from websockets.sync.client import connect as ws_connect
+    from websockets.exceptions import WebSocketException
+except ImportError:
+    ws_connect = None
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+from utils import EXCEL_ENGINE, validate_frequency_frame, format_file_size, file_digest
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ARROW_MIME = "application/vnd.apache.arrow.file"
+
+# Largest upload accepted; matches server.maxUploadSize in .streamlit/config.toml
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+
+# Send the parsed THz column as Arrow instead of the raw workbook when pyarrow
+# (a Streamlit dependency) is importable; checked without importing it
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# One pooled keep-alive session for every backend call, so reruns reuse the
+# TCP/TLS connection instead of paying a new handshake per request.
+# urllib3 only retries idempotent methods, so uploads are never sent twice.
+SESSION = requests.Session()
+SESSION.headers["Connection"] = "keep-alive"
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Interface strings per language; text shared by every language stays inline
+STRINGS = {
+    "en": {
+        # Progress stages reported by the backend on /events/{job_id}
+        "stages": {
+            "queued": "Queued...",
+            "reading": "Reading frequencies...",
+            "generating": "Generating audio...",
+            "encoding": "Encoding MP3...",
+            "done": "Done!",
+            "failed": "Failed",
+        },
+        "processing_failed": "Processing failed",
+        "unknown_error": "Unknown error",
+        "timeout": "Processing timeout. The file might be too large or the server is busy.",
+        "network_error": "Network error",
+        "unexpected_error": "Unexpected error",
+        "download_failed": "Download failed",
+        "download_error": "Download error",
+        "upload_header": "📁 File Upload",
+        "company_label": "Company Name",
+        "company_placeholder": "Enter your company name",
+        "company_help": "This will be used in the generated file names and reports",
+        "file_label": "Choose Excel file",
+        "file_help": "Upload an Excel file containing frequency data in THz column",
+        "file_uploaded": "📄 File uploaded",
+        "file_size": "Size",
+        "file_too_large": "File too large (max {limit})",
+        "parsing": "Reading spreadsheet...",
+        "excel_read_error": "Error reading Excel file",
+        "valid_rows": "✅ Valid Excel file with {count} rows",
+        "thz_found": "✅ Found required 'THz' column with {count} frequencies",
+        "processing_header": "📊 Processing Center",
+        "preview_header": "📋 File Preview",
+        "stats_title": "**Frequency Statistics:**",
+        "stat_total": "Total Frequencies",
+        "stat_min": "Min (THz)",
+        "stat_max": "Max (THz)",
+        "stat_mean": "Mean (THz)",
+        "file_read_error": "Error reading file",
+        "audio_header": "🎯 Audio Processing",
+        "process_button": "🚀 Generate Audio & Report",
+        "spinner": "Processing your file... This may take a few minutes.",
+        "completed": "🎉 Processing completed successfully!",
+        "results_header": "📥 Download Results",
+        "processing_id": "🆔 Processing ID",
+        "new_file": "🔄 Process New File",
+        "info_header": "ℹ️ Information",
+        "status_processing": "🔄 Processing in progress...",
+        "status_completed": "✅ Processing completed",
+        "status_failed": "❌ Processing failed",
+    },
+    "pt": {
+        "stages": {
+            "queued": "Na fila...",
+            "reading": "Lendo frequências...",
+            "generating": "Gerando áudio...",
+            "encoding": "Codificando MP3...",
+            "done": "Concluído!",
+            "failed": "Falhou",
+        },
+        "processing_failed": "Falha no processamento",
+        "unknown_error": "Erro desconhecido",
+        "timeout": "Timeout no processamento. O arquivo pode ser muito grande.",
+        "network_error": "Erro de conexão",
+        "unexpected_error": "Erro inesperado",
+        "download_failed": "Falha no download",
+        "download_error": "Erro no download",
+        "upload_header": "📁 Upload de Arquivo",
+        "company_label": "Nome da Empresa",
+        "company_placeholder": "Digite o nome da sua empresa",
+        "company_help": "Será usado nos nomes dos arquivos gerados",
+        "file_label": "Escolha o arquivo Excel",
+        "file_help": "Faça upload de um arquivo Excel contendo dados de frequência na coluna THz",
+        "file_uploaded": "📄 Arquivo carregado",
+        "file_size": "Tamanho",
+        "file_too_large": "Arquivo muito grande (máximo {limit})",
+        "parsing": "Lendo planilha...",
+        "excel_read_error": "Erro ao ler arquivo Excel",
+        "valid_rows": "✅ Arquivo Excel válido com {count} linhas",
+        "thz_found": "✅ Encontrada coluna 'THz' com {count} frequências",
+        "processing_header": "📊 Centro de Processamento",
+        "preview_header": "📋 Prévia do Arquivo",
+        "stats_title": "**Estatísticas das Frequências:**",
+        "stat_total": "Total de Frequências",
+        "stat_min": "Mín (THz)",
+        "stat_max": "Máx (THz)",
+        "stat_mean": "Média (THz)",
+        "file_read_error": "Erro ao ler arquivo",
+        "audio_header": "🎯 Processamento de Áudio",
+        "process_button": "🚀 Gerar Áudio",
+        "spinner": "Processando seu arquivo... Isso pode levar alguns minutos.",
+        "completed": "🎉 Processamento concluído com sucesso!",
+        "results_header": "📥 Resultados do Processamento",
+        "processing_id": "🆔 ID do Processamento",
+        "new_file": "🔄 Processar Novo Arquivo",
+        "info_header": "ℹ️ Informações",
+        "status_processing": "🔄 Processamento em andamento...",
+        "status_completed": "✅ Processamento concluído",
+        "status_failed": "❌ Falha no processamento",
+    },
+}
+
+def load_preview(file_bytes: bytes) -> dict:
+    """Parse the THz column of an upload and derive everything the page displays"""
+    # Imported here so workers that never get an upload skip loading pandas
+    import pandas as pd
+    from io import BytesIO
+
+    df = pd.read_excel(BytesIO(file_bytes), engine=EXCEL_ENGINE, usecols=lambda column: column == "THz")
+    validation = validate_frequency_frame(df)
+    preview = {"validation": validation, "head": df.head(10), "stats": None}
+    if validation["valid"]:
+        # One contiguous float64 buffer for NumPy's reductions; float32 would
+        # round away the 6 decimals the metrics display
+        thz_data = validation["thz"]
+        preview["stats"] = {
+            "count": thz_data.size,
+            "min": float(thz_data.min()),
+            "max": float(thz_data.max()),
+            "mean": float(thz_data.mean())
+        }
+    return preview
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _probe_api(api_base_url, timeout):
+    """Probe the backend root; raises when it is down, and st.cache_data never caches a raise"""
+    response = SESSION.get(f"{api_base_url}/", timeout=timeout)
+    response.raise_for_status()
+    return True
+
+def check_api_connection(api_base_url, timeout=15):
+    """Check if the FastAPI backend is accessible (a success is reused for 30 s, a failure is retried on the next rerun)"""
+    try:
+        return _probe_api(api_base_url, timeout)
+    except requests.exceptions.RequestException:
+        return False
+
+def follow_job_websocket(api_base_url, job_id, text, on_progress=None):
+    """Follow a background job over the /ws/{job_id} WebSocket until it finishes"""
+    ws_base = api_base_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+    with ws_connect(f"{ws_base}/ws/{job_id}", open_timeout=15) as ws:
+        while True:
+            msg = json.loads(ws.recv(timeout=300))
+            if on_progress and "pct" in msg:
+                on_progress(msg["pct"], text["stages"].get(msg["stage"], msg["stage"]))
+            if msg["type"] == "done":
+                return msg["result"]
+            if msg["type"] == "error":
+                st.error(f"{text['processing_failed']}: {msg.get('detail', text['unknown_error'])}")
+                return None
+
+def gzip_chunks(chunks):
+    """Gzip an iterable of byte chunks on the fly (level 1: the upload is I/O bound)"""
+    deflater = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield deflater.compress(chunk)
+    yield deflater.flush()
+
+def poll_job_status(api_base_url, job_id, text, on_progress=None):
+    """Follow a background job by long polling /jobs/{job_id}/status until it finishes"""
+    version = -1
+    while True:
+        # The server holds each request until the state moves past `version` (25 s at most)
+        response = SESSION.get(f"{api_base_url}/jobs/{job_id}/status", params={"version": version}, timeout=30)
+        response.raise_for_status()
+        status = response.json()
+        version = status["version"]
+        if on_progress:
+            on_progress(status["pct"], text["stages"].get(status["stage"], status["stage"]))
+        if status["done"]:
+            if "result" in status:
+                return status["result"]
+            st.error(f"{text['processing_failed']}: {status.get('error', text['unknown_error'])}")
+            return None
+
+def frequencies_to_arrow(frequencies):
+    """Serialize THz values as a zstd-compressed Arrow IPC file object"""
+    import pyarrow as pa
+    from io import BytesIO
+
+    table = pa.table({"THz": pa.array(frequencies, type=pa.float64())})
+    sink = BytesIO()
+    with pa.ipc.new_file(sink, table.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")) as writer:
+        writer.write_table(table)
+    sink.seek(0)
+    sink.name = "frequencies.arrow"
+    return sink
+
+def post_upload(url, file, company_name, timeout, compress=False, mime=XLSX_MIME, fields=None):
+    """POST the upload as multipart, streamed from the file object when requests-toolbelt is installed.
+
+    With ``compress`` the body is sent with Content-Encoding: gzip; only
+    legacy .xls files are compressed, .xlsx is already a deflated zip.
+    ``fields`` adds extra form fields next to the company name.
+    """
+    file.seek(0)
+    upload = (file.name, file, mime)
+    form = {"company_name": company_name, **(fields or {})}
+    compress = compress and file.name.lower().endswith(".xls")
+    if MultipartEncoder is None:
+        if not compress:
+            return SESSION.post(url, files={"file": upload}, data=form, timeout=timeout)
+        body, content_type = encode_multipart_formdata({**form, "file": (file.name, file.read(), mime)})
+        return SESSION.post(
+            url,
+            data=zlib.compress(body, 1, wbits=16 + zlib.MAX_WBITS),
+            headers={"Content-Type": content_type, "Content-Encoding": "gzip"},
+            timeout=timeout
+        )
+    encoder = MultipartEncoder(fields={**form, "file": upload})
+    if not compress:
+        return SESSION.post(url, data=encoder, headers={"Content-Type": encoder.content_type}, timeout=timeout)
+    return SESSION.post(
+        url,
+        data=gzip_chunks(iter(lambda: encoder.read(64 * 1024), b"")),
+        headers={"Content-Type": encoder.content_type, "Content-Encoding": "gzip"},
+        timeout=timeout
+    )
+
+def upload_and_process_file(api_base_url, file, company_name, text, on_progress=None, frequencies=None):
+    """Upload Excel file and follow its processing progress over a WebSocket, Server-Sent Events or long polling.
+
+    When the already-parsed ``frequencies`` are given, /jobs receives just
+    that column as Arrow; the raw workbook is only sent to older backends.
+    """
+    try:
+        # /jobs only exists on backends that also inflate gzip request bodies;
+        # Arrow needs pyarrow on both ends
+        response = None
+        if frequencies is not None and ARROW_AVAILABLE:
+            response = post_upload(
+                f"{api_base_url}/jobs", frequencies_to_arrow(frequencies), company_name,
+                timeout=60, mime=ARROW_MIME, fields={"format": "arrow"}
+            )
+
+        if response is None or response.status_code == 415:
+            # No pyarrow here, or a backend without it: send the workbook itself
+            response = post_upload(f"{api_base_url}/jobs", file, company_name, timeout=60, compress=True)
+
+        if response.status_code == 404:
+            # Backend without job support: fall back to the blocking endpoint
+            response = post_upload(f"{api_base_url}/process-audio", file, company_name, timeout=300)
+            if response.status_code == 200:
+                return response.json()
+            error_detail = response.json().get("detail", text["unknown_error"])
+            st.error(f"{text['processing_failed']}: {error_detail}")
+            return None
+
+        if response.status_code != 200:
+            error_detail = response.json().get("detail", text["unknown_error"])
+            st.error(f"{text['processing_failed']}: {error_detail}")
+            return None
+
+        job_id = response.json()["job_id"]
+        if ws_connect is not None:
+            try:
+                return follow_job_websocket(api_base_url, job_id, text, on_progress)
+            except (OSError, WebSocketException):
+                # WebSocket not reachable or dropped (proxy, firewall...): use Server-Sent Events instead
+                pass
+
+        try:
+            with SESSION.get(f"{api_base_url}/events/{job_id}", stream=True, timeout=300) as events:
+                for line in events.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[len("data:"):])
+                    if on_progress:
+                        on_progress(event["pct"], text["stages"].get(event["stage"], event["stage"]))
+                    if event["done"]:
+                        if "result" in event:
+                            return event["result"]
+                        st.error(f"{text['processing_failed']}: {event.get('error', text['unknown_error'])}")
+                        return None
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError, requests.exceptions.ReadTimeout):
+            # Stream cut by a proxy or idle timeout: keep following the job by long polling
+            pass
+
+        return poll_job_status(api_base_url, job_id, text, on_progress)
+
+    except requests.exceptions.Timeout:
+        st.error(text["timeout"])
+        return None
+    except requests.exceptions.RequestException as e:
+        st.error(f"{text['network_error']}: {str(e)}")
+        return None
+    except Exception as e:
+        st.error(f"{text['unexpected_error']}: {str(e)}")
+        return None
+
+def download_file(api_base_url, file_type, company_name, filename, text):
+    """Download generated files from the API"""
+    try:
+        with SESSION.get(
+            f"{api_base_url}/download/{file_type}/{company_name}/{filename}",
+            stream=True,
+            timeout=30
+        ) as response:
+            if response.status_code == 200:
+                from io import BytesIO
+
+                # st.download_button takes bytes or BytesIO (not a spooled
+                # temp file) and holds the whole payload in memory anyway
+                downloaded = BytesIO()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    downloaded.write(chunk)
+                downloaded.seek(0)
+                return downloaded
+            st.error(f"{text['download_failed']}: {response.status_code}")
+            return None
+
+    except requests.exceptions.RequestException as e:
+        st.error(f"{text['download_error']}: {str(e)}")
+        return None
+
+def render(api_base_url: str, lang: str, stop_if_offline: bool = False, health_timeout: float = 15):
+    """Render the whole NeuroAudio interface against the given backend.
+
+    ``lang`` picks the interface strings ("en" or "pt"). With
+    ``stop_if_offline`` the page halts when the backend does not answer
+    instead of letting the user try anyway. ``health_timeout`` bounds the
+    connection check in seconds; the default leaves room for a Render
+    cold start.
+    """
+    text = STRINGS[lang]
+
+    # Configure page
+    st.set_page_config(
+        page_title="NeuroAudio Processing System",
+        page_icon="🎵",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Initialize session state
+    if 'processing_status' not in st.session_state:
+        st.session_state.processing_status = None
+    if 'job_id' not in st.session_state:
+        st.session_state.job_id = None
+    if 'results' not in st.session_state:
+        st.session_state.results = None
+    if 'company_name' not in st.session_state:
+        st.session_state.company_name = ""
+    if 'parse_executor' not in st.session_state:
+        # Parse of the current upload, run on a per-session worker thread
+        st.session_state.parse_executor = ThreadPoolExecutor(max_workers=1)
+        st.session_state.preview = None
+        st.session_state.preview_digest = None
+        st.session_state.preview_file_id = None
+
+    # Main UI
+    st.title("🎵 NeuroAudio Processing System")
+    st.markdown("---")
+
+    # Check API connection
+    with st.spinner("Conectando à API..."):
+        api_connected = check_api_connection(api_base_url, health_timeout)
+
+    if not api_connected:
+        if stop_if_offline:
+            st.error("⚠️ API Backend não está disponível. Verifique a configuração da API_BASE_URL.")
+            st.info("Configure a variável API_BASE_URL nas configurações do Streamlit Cloud.")
+            st.stop()
+        st.warning("⚠️ API Backend não está disponível")
+        if "render.com" in api_base_url:
+            st.info("🔄 A API do Render pode estar hibernando (plano gratuito). Aguarde alguns segundos e recarregue a página.")
+            st.info("💡 A primeira requisição pode demorar até 1 minuto para ativar o serviço.")
+        else:
+            st.info("🔧 Para usar localmente, execute: `python main.py` na pasta backend")
+
+        # Don't stop completely, allow user to try anyway
+        st.warning("⚠️ Tentativas de processamento podem falhar até a API estar ativa")
+    else:
+        st.success(f"✅ Conectado à API NeuroAudio")
+        if "localhost" in api_base_url:
+            st.info("🏠 Usando API local")
+        else:
+            st.info("☁️ Usando API do Render")
+
+    # Sidebar for file upload and configuration
+    with st.sidebar:
+        st.header(text["upload_header"])
+
+        # Company name input
+        company_name = st.text_input(
+            text["company_label"],
+            value=st.session_state.company_name,
+            placeholder=text["company_placeholder"],
+            help=text["company_help"]
+        )
+
+        if company_name:
+            st.session_state.company_name = company_name
+
+        # File upload
+        uploaded_file = st.file_uploader(
+            text["file_label"],
+            type=['xlsx', 'xls'],
+            help=text["file_help"]
+        )
+
+        if uploaded_file is not None:
+            st.success(f"{text['file_uploaded']}: {uploaded_file.name}")
+            st.info(f"{text['file_size']}: {format_file_size(uploaded_file.size)}")
+
+            if uploaded_file.size > MAX_UPLOAD_BYTES:
+                # Refuse before hashing, parsing or uploading anything
+                validation_result = {
+                    "valid": False,
+                    "error": text["file_too_large"].format(limit=format_file_size(MAX_UPLOAD_BYTES))
+                }
+            else:
+                # Parse and validate file once per distinct upload; reruns reuse the
+                # session's parse, a different file (new digest) replaces it
+                try:
+                    # Hash only when the uploader hands over a new file, not on every
+                    # rerun; re-uploading identical bytes still reuses the parse
+                    if st.session_state.preview_file_id != uploaded_file.file_id:
+                        file_bytes = uploaded_file.getvalue()
+                        digest = file_digest(file_bytes)
+                        if st.session_state.preview_digest != digest:
+                            st.session_state.preview = st.session_state.parse_executor.submit(load_preview, file_bytes)
+                            st.session_state.preview_digest = digest
+                        st.session_state.preview_file_id = uploaded_file.file_id
+                    future = st.session_state.preview
+                    if not future.done():
+                        # Wait off the parse thread; touching the placeholder lets an
+                        # interaction interrupt this rerun while the parse carries on
+                        parsing_status = st.empty()
+                        started = time.monotonic()
+                        while not future.done():
+                            parsing_status.caption(f"{text['parsing']} {time.monotonic() - started:.1f}s")
+                            time.sleep(0.1)
+                        parsing_status.empty()
+                    preview = future.result()
+                    validation_result = preview["validation"]
+                except Exception as e:
+                    validation_result = {"valid": False, "error": f"{text['excel_read_error']}: {str(e)}"}
+            if validation_result["valid"]:
+                st.success(text["valid_rows"].format(count=validation_result['row_count']))
+                st.success(text["thz_found"].format(count=validation_result['frequency_count']))
+            else:
+                st.error(f"❌ {validation_result['error']}")
+                uploaded_file = None
+
+    # Main content area
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.header(text["processing_header"])
+
+        # File preview
+        if uploaded_file is not None and company_name:
+            st.subheader(text["preview_header"])
+            try:
+                stats = preview["stats"]
+                if stats is not None:
+                    # Show first few rows
+                    st.dataframe(preview["head"], use_container_width=True)
+
+                    # Show statistics
+                    st.markdown(text["stats_title"])
+                    col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+                    with col_stat1:
+                        st.metric(text["stat_total"], stats["count"])
+                    with col_stat2:
+                        st.metric(text["stat_min"], f"{stats['min']:.6f}")
+                    with col_stat3:
+                        st.metric(text["stat_max"], f"{stats['max']:.6f}")
+                    with col_stat4:
+                        st.metric(text["stat_mean"], f"{stats['mean']:.6f}")
+
+            except Exception as e:
+                st.error(f"{text['file_read_error']}: {str(e)}")
+
+        # Processing section
+        st.subheader(text["audio_header"])
+
+        # Process button
+        if st.button(
+            text["process_button"],
+            disabled=not (uploaded_file and company_name),
+            use_container_width=True
+        ):
+            if uploaded_file and company_name:
+                st.session_state.processing_status = "processing"
+                st.session_state.results = None
+
+                with st.spinner(text["spinner"]):
+                    progress_bar = st.progress(0)
+                    status_text = st.empty()
+
+                    def show_progress(pct, label):
+                        progress_bar.progress(pct)
+                        status_text.text(label)
+
+                    # Process the file
+                    results = upload_and_process_file(
+                        api_base_url, uploaded_file, company_name, text, on_progress=show_progress,
+                        frequencies=preview["validation"]["thz"]
+                    )
+
+                    if results:
+                        st.session_state.results = results
+                        st.session_state.processing_status = "completed"
+                        st.success(text["completed"])
+                        st.rerun()
+                    else:
+                        st.session_state.processing_status = "failed"
+
+        # Results section
+        if st.session_state.processing_status == "completed" and st.session_state.results:
+            st.subheader(text["results_header"])
+
+            results = st.session_state.results
+
+            # Display results info
+            st.info(f"{text['processing_id']}: {results.get('aroma_id', 'N/A')}")
+
+            # Automatic audio download
+            st.markdown("**🎵 Arquivo de Áudio Gerado**")
+            audio_filename = results.get('audio_file')
+            frequencies_count = results.get('frequencies_processed', 0)
+
+            st.success(f"✅ Processamento concluído! {frequencies_count} frequências convertidas em áudio.")
+
+            if audio_filename:
+                audio_data = download_file(api_base_url, "audio", company_name, audio_filename, text)
+                if audio_data:
+                    st.download_button(
+                        label="📥 Baixar Arquivo de Áudio (MP3)",
+                        data=audio_data,
+                        file_name=audio_filename,
+                        mime="audio/mpeg",
+                        use_container_width=True
+                    )
+                    st.info(f"📄 Arquivo: {audio_filename} | Duração: 30 segundos")
+
+            # Clear results button
+            if st.button(text["new_file"], use_container_width=True):
+                st.session_state.processing_status = None
+                st.session_state.results = None
+                st.session_state.job_id = None
+                st.rerun()
+
+    with col2:
+        st.header(text["info_header"])
+
+        # System info
+        st.subheader("🔧 Requisitos do Sistema")
+        st.markdown("""
+        **Formato do Arquivo Excel:**
+        - Deve conter uma coluna chamada 'THz'
+        - Frequências em unidades Terahertz
+        - Formatos suportados: .xlsx, .xls
+
+        **Saída:**
+        - 🎵 Arquivo de áudio MP3 (30 segundos)
+        - 📊 Conversão automática THz para Hz
+        - 🎧 Pronto para download automático
+        """)
+
+        # Processing info
+        st.subheader("⚙️ Detalhes do Processamento")
+        st.markdown("""
+        **Geração de Áudio:**
+        - Duração: 30 segundos
+        - Taxa de Amostragem: 44.1 kHz
+        - Taxa de Bits: 192 kbps
+        - Formato: MP3
+
+        **Faixa de Frequência:**
+        - Mínimo: 18 kHz
+        - Máximo: 22 kHz
+        - Conversão: THz → Hz
+        """)
+
+        # Status indicator
+        if st.session_state.processing_status:
+            st.subheader("📊 Status")
+            if st.session_state.processing_status == "processing":
+                st.warning(text["status_processing"])
+            elif st.session_state.processing_status == "completed":
+                st.success(text["status_completed"])
+            elif st.session_state.processing_status == "failed":
+                st.error(text["status_failed"])
+
+    # Footer
+    st.markdown("---")
+    st.markdown(
+        """
+        <div style='text-align: center; color: #666;'>
+            <p>Copyright Cycor Cibernética 2025 - Todos os direitos reservados</p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
@@ -1,49 +1,77 @@
-import pandas as pd
 import os
-from io import BytesIO
+import re
+import importlib.util
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Rust-backed calamine reader when available; pandas' default (openpyxl) otherwise
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# Patterns of sanitize_company_name, compiled once at import
+_NON_PATH_CHARS = re.compile(r'[^\w\s-]')
+_SEPARATOR_RUNS = re.compile(r'[-\s]+')
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+def validate_frequency_frame(df):
+    """Validate an already-parsed DataFrame holding the THz column"""
+    import numpy as np
+    import pandas as pd
+    
+    # Check if THz column exists
+    if 'THz' not in df.columns:
+        return {
+            "valid": False,
+            "error": "Excel file must contain a column named 'THz'"
+        }
+    
+    # Check for valid frequency data
+    thz_column = df['THz'].dropna()
+    if len(thz_column) == 0:
+        return {
+            "valid": False,
+            "error": "Nenhuma frequência válida encontrada na coluna THz"
+        }
+    
+    # Check for numeric data and positive values; numeric columns (the usual
+    # case) convert without the element-wise object parse of to_numeric
+    try:
+        if pd.api.types.is_numeric_dtype(thz_column) and not pd.api.types.is_bool_dtype(thz_column):
+            thz_values = thz_column.to_numpy(dtype=np.float64)
+        else:
+            thz_values = pd.to_numeric(thz_column, errors='raise').to_numpy(dtype=np.float64)
+        positive_count = len(thz_column)
+    except ValueError:
+        return {
+            "valid": False,
+            "error": "Coluna THz contém valores não numéricos"
+        }
+    
+    return {
+        "valid": True,
+        "row_count": len(df),
+        "frequency_count": positive_count,
+        "thz": thz_values
+    }
 
 def validate_excel_file(uploaded_file):
     """Validate the uploaded Excel file"""
+    import pandas as pd
+    
     try:
         # Reset file pointer
         uploaded_file.seek(0)
         
-        # Read Excel file
-        df = pd.read_excel(uploaded_file)
-        
-        # Check if THz column exists
-        if 'THz' not in df.columns:
-            return {
-                "valid": False,
-                "error": "Excel file must contain a column named 'THz'"
-            }
-        
-        # Check for valid frequency data
-        thz_column = df['THz'].dropna()
-        if len(thz_column) == 0:
-            return {
-                "valid": False,
-                "error": "Nenhuma frequência válida encontrada na coluna THz"
-            }
-        
-        # Check for numeric data and positive values
-        try:
-            pd.to_numeric(thz_column, errors='raise')
-            positive_count = len(thz_column)
-        except ValueError:
-            return {
-                "valid": False,
-                "error": "Coluna THz contém valores não numéricos"
-            }
+        # Read only the THz column of the Excel file
+        df = pd.read_excel(uploaded_file, engine=EXCEL_ENGINE, usecols=lambda column: column == 'THz')
         
         # Reset file pointer for later use
         uploaded_file.seek(0)
         
-        return {
-            "valid": True,
-            "row_count": len(df),
-            "frequency_count": positive_count
-        }
+        return validate_frequency_frame(df)
         
     except Exception as e:
         return {
@@ -51,6 +79,12 @@ def validate_excel_file(uploaded_file):
             "error": f"Error reading Excel file: {str(e)}"
         }
 
+def file_digest(data):
+    """Content hash of uploaded bytes for cache keys: BLAKE3 when installed, BLAKE2b otherwise"""
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 def format_file_size(size_bytes):
     """Format file size in human readable format"""
     if size_bytes == 0:
@@ -64,8 +98,16 @@ def format_file_size(size_bytes):
     
     return f"{size_bytes:.1f} {size_names[i]}"
 
+# First API URL that answered, kept for the process lifetime; Streamlit
+# reruns app.py on every interaction and would otherwise probe again
+_api_base_url = None
+
 def get_api_base_url():
     """Get the API base URL with fallback support"""
+    global _api_base_url
+    if _api_base_url is not None:
+        return _api_base_url
+    
     import streamlit as st
     import requests
     
@@ -89,24 +131,33 @@ def get_api_base_url():
         "http://localhost:8000"  # Local fallback
     ])
     
-    # Test each URL and return the first working one
-    for url in api_urls:
+    def probe(url):
         try:
-            response = requests.get(f"{url}/", timeout=10)
-            if response.status_code == 200:
-                return url
+            return requests.get(f"{url}/", timeout=10).status_code == 200
         except:
-            continue
+            return False
+    
+    # Probe all URLs at once, then take the first working one in priority
+    # order: the wait is one round-trip (at worst one timeout), not one per URL
+    executor = ThreadPoolExecutor(max_workers=len(api_urls))
+    try:
+        probes = [executor.submit(probe, url) for url in api_urls]
+        for url, reachable in zip(api_urls, probes):
+            if reachable.result():
+                _api_base_url = url
+                return url
+    finally:
+        # Lower-priority probes still in flight finish in the background
+        executor.shutdown(wait=False)
     
-    # Return first URL as last resort
+    # Return first URL as last resort (not cached, so the next run probes again)
     return api_urls[0] if api_urls else "http://localhost:8000"
 
 def sanitize_company_name(company_name):
     """Sanitize company name for use in file paths"""
     # Remove special characters and spaces
-    import re
-    sanitized = re.sub(r'[^\w\s-]', '', company_name)
-    sanitized = re.sub(r'[-\s]+', '_', sanitized)
+    sanitized = _NON_PATH_CHARS.sub('', company_name)
+    sanitized = _SEPARATOR_RUNS.sub('_', sanitized)
     return sanitized.strip('_')
 
 def get_file_extension(filename):